@@ -0,0 +1,97 @@
+"""
+CSV vs columnar store round-trip benchmark.
+
+Scales data/raw/spy_prices.csv up to a synthetic universe (perturbed copies
+of SPY, optionally with the history tiled forward in time) and times:
+
+- write: df.to_csv vs write_prices
+- full read: pd.read_csv(parse_dates=True) vs read_prices
+- projected read: last year of 'price' only
+
+Run from the repository root:
+    python -m benchmarks.bench_price_store --tickers 200 --repeat 4
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.price_store import read_prices, write_prices
+
+SPY_CSV = Path("data/raw/spy_prices.csv")
+
+
+def synthetic_universe(n_tickers: int, repeat: int, seed: int = 0) -> dict:
+    """
+    Perturbed copies of SPY, with the history tiled `repeat` times.
+    """
+    spy = pd.read_csv(SPY_CSV, index_col=0, parse_dates=True)["price"]
+    log_ret = np.diff(np.log(spy.to_numpy()))
+    log_ret = np.tile(log_ret, repeat)
+    dates = pd.bdate_range(spy.index[0], periods=len(log_ret) + 1, name="Date")
+
+    rng = np.random.default_rng(seed)
+    universe = {}
+    for i in range(n_tickers):
+        noise = rng.normal(0.0, 0.005, len(log_ret))
+        path = spy.iloc[0] * np.exp(np.concatenate([[0.0], np.cumsum(log_ret + noise)]))
+        universe[f"SYN{i:04d}"] = pd.DataFrame({"price": path}, index=dates)
+    return universe
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def run(n_tickers: int, repeat: int) -> pd.DataFrame:
+    universe = synthetic_universe(n_tickers, repeat)
+    n_rows = len(next(iter(universe.values())))
+    last_year = next(iter(universe.values())).index[-252]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_dir = Path(tmp) / "csv"
+        store_dir = Path(tmp) / "store"
+        csv_dir.mkdir()
+
+        timings = {
+            ("write", "csv"): _timed(
+                lambda: [df.to_csv(csv_dir / f"{t}.csv") for t, df in universe.items()]
+            ),
+            ("write", "store"): _timed(
+                lambda: [write_prices(df, t, store_dir) for t, df in universe.items()]
+            ),
+            ("full read", "csv"): _timed(
+                lambda: [pd.read_csv(csv_dir / f"{t}.csv", index_col=0, parse_dates=True)
+                         for t in universe]
+            ),
+            ("full read", "store"): _timed(
+                lambda: [read_prices(t, root=store_dir) for t in universe]
+            ),
+            ("projected read", "csv"): _timed(
+                lambda: [pd.read_csv(csv_dir / f"{t}.csv", index_col=0, parse_dates=True)
+                         .loc[last_year:, ["price"]] for t in universe]
+            ),
+            ("projected read", "store"): _timed(
+                lambda: [read_prices(t, columns=["price"], start=last_year, root=store_dir)
+                         for t in universe]
+            ),
+        }
+
+    table = pd.Series(timings).unstack()
+    table["speedup"] = table["csv"] / table["store"]
+    print(f"{n_tickers} tickers x {n_rows} rows")
+    print(table.round(4).to_string())
+    return table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tickers", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=4)
+    args = parser.parse_args()
+    run(args.tickers, args.repeat)
@@ -1,7 +1,12 @@
+from pathlib import Path
+
 import dash
 import dash_bootstrap_components as dbc
+import pandas as pd
 from dash import html, dcc
 
+VOL_CONE_CSV = Path(__file__).resolve().parent.parent / "reports/results/vol_cone.csv"
+
 # -------------------------------------------------
 # App setup
 # -------------------------------------------------
@@ -27,6 +32,19 @@ def kpi_card(title, value):
         className="kpi-card",
     )
 
+# -------------------------------------------------
+# Vol cone table
+# -------------------------------------------------
+def vol_cone_table():
+    if not VOL_CONE_CSV.exists():
+        return html.Div("Run main.py to generate the volatility cone.")
+    cone = pd.read_csv(VOL_CONE_CSV)
+    value_cols = [c for c in cone.columns if c not in ("asset", "window")]
+    cone[value_cols] = cone[value_cols].round(4)
+    return dbc.Table.from_dataframe(
+        cone, striped=True, bordered=False, hover=True, size="sm"
+    )
+
 # -------------------------------------------------
 # Layout
 # -------------------------------------------------
@@ -121,6 +139,23 @@ app.layout = dbc.Container(
                     ],
                 ),
 
+                # -------- Vol cone --------
+                dbc.Tab(
+                    label="📐 Volatility Cone",
+                    children=[
+                        html.Div(
+                            [
+                                html.H4(
+                                    "Realized Volatility Cone — Percentiles by Horizon",
+                                    className="section-title",
+                                ),
+                                vol_cone_table(),
+                            ],
+                            className="section-card",
+                        )
+                    ],
+                ),
+
                 # -------- Stress --------
                 dbc.Tab(
                     label="⚠️ Stress Testing",
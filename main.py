@@ -3,10 +3,12 @@ VOLATILITY & RISK ANALYTICS SYSTEM
 =================================
 End-to-end institutional-grade volatility and tail-risk framework.
 
-✔ Loads market data
-✔ Computes returns & realized volatility
-✔ Fits GARCH / EGARCH / TGARCH / GARCH-t
-✔ ML walk-forward volatility forecasting (RF + XGB)
+✔ Loads market data (yfinance, local files or synthetic — offline capable)
+✔ Scans prices for bad prints, gaps, stale repeats & split-like jumps
+✔ Computes returns & realized volatility (+ realized-vol cone)
+✔ Fits GARCH / EGARCH / TGARCH / GARCH-t (in-sample or rolling out-of-sample),
+  reusing cached fits while the price history is unchanged
+✔ ML walk-forward volatility forecasting (RF + XGB) and HAR-RV benchmark
 ✔ Parametric 99% VaR (Gaussian & Student-t)
 ✔ VaR breach visualization
 ✔ Kupiec & Christoffersen regulatory tests
@@ -19,25 +21,36 @@ End-to-end institutional-grade volatility and tail-risk framework.
 # IMPORTS
 # =================================================
 import os
+import argparse
 import matplotlib.pyplot as plt
 import matplotlib as mpl
 import pandas as pd
 
-from src.data_loader import download_price_data
+from src.data_loader import download_price_data, refresh_price_data
+from src.cache import DiskCache
+from src.price_sources import PRICE_SOURCES, CachedSource, get_price_source
+from src.data_quality import scan_price_panel, summarize_quality, write_quality_report
 from src.returns import compute_log_returns
-from src.realized_vol import realized_volatility
+from src.realized_vol import (
+    RANGE_ESTIMATORS,
+    range_volatility,
+    realized_volatility,
+    vol_cone
+)
 
 from src.garch_models import (
-    garch_vol,
-    egarch_vol,
-    tgarch_vol,
-    garch_t_vol
+    MODEL_REGISTRY,
+    fit_all,
+    fit_summary,
+    rolling_garch_forecast
 )
+from src.garch_cache import GarchFitCache
 
 from src.ml_models import (
     create_volatility_features,
     walk_forward_ml_forecast
 )
+from src.har_model import create_har_features, walk_forward_har_forecast
 
 from src.risk_metrics import (
     parametric_var_cvar,
@@ -74,7 +87,15 @@ mpl.rcParams.update({
 # =================================================
 # MAIN PIPELINE
 # =================================================
-def main():
+def main(
+    ticker: str = "SPY",
+    source: str = "yfinance",
+    data_dir: str = None,
+    cache_ttl: float = None,
+    benchmark_vol: str = "close",
+    garch_oos: bool = False,
+    garch_cache: bool = True
+):
 
     print("\nVOLATILITY & RISK ANALYTICS SYSTEM")
     print("=================================\n")
@@ -88,7 +109,34 @@ def main():
     # =================================================
     # 1. LOAD DATA
     # =================================================
-    prices = download_price_data("SPY")
+    kwargs = {"root": data_dir} if source == "file" and data_dir else {}
+    price_source = get_price_source(source, **kwargs)
+    if cache_ttl is not None:
+        price_source = CachedSource(price_source, DiskCache(ttl=cache_ttl * 3600))
+
+    # Range-based benchmarks need the OHLC bars (same single request)
+    fields = "price" if benchmark_vol == "close" else "ohlcv"
+
+    # Network downloads go through the incremental store; offline sources
+    # are read directly so they never overwrite stored market data.
+    if source == "yfinance":
+        prices = refresh_price_data(ticker, source=price_source, fields=fields)
+    else:
+        prices = download_price_data(ticker, source=price_source, fields=fields)
+
+    if cache_ttl is not None:
+        stats = price_source.cache.stats()
+        print(f"Price cache: {stats['hits']} hits / {stats['misses']} misses\n")
+
+    # -------------------------------------------------
+    # Data quality scan
+    # -------------------------------------------------
+    quality = scan_price_panel(prices[["price"]].rename(columns={"price": ticker}))
+    write_quality_report(quality, "reports/results/data_quality.csv")
+    if len(quality):
+        print("DATA QUALITY FLAGS")
+        print("------------------")
+        print(summarize_quality(quality).to_string(), "\n")
 
     # =================================================
     # 2. RETURNS
@@ -101,15 +149,50 @@ def main():
     # =================================================
     rv = realized_volatility(returns_df)
 
+    # Benchmark series for the GARCH comparison: close-to-close by default,
+    # or a range-based estimator on the same scale and index
+    if benchmark_vol == "close":
+        benchmark = rv
+        benchmark_label = "Realized Vol"
+    else:
+        benchmark = range_volatility(prices, benchmark_vol).reindex(rv.index)
+        benchmark_label = f"Realized Vol ({benchmark_vol.replace('_', '-').title()})"
+
+    # Realized-vol cone for the dashboard
+    cone = vol_cone(returns_df.rename(columns={"log_return": ticker}))
+    cone.round(6).to_csv("reports/results/vol_cone.csv")
+
     # =================================================
     # 4. GARCH FAMILY MODELS
     # =================================================
     print("Fitting GARCH-family models...\n")
 
-    garch_sigma   = garch_vol(returns).loc[rv.index]
-    egarch_sigma  = egarch_vol(returns).loc[rv.index]
-    tgarch_sigma  = tgarch_vol(returns).loc[rv.index]
-    garch_t_sigma = garch_t_vol(returns).loc[rv.index]
+    # Unchanged returns reuse the stored fits; new data warm-starts the
+    # optimiser from the previous parameters
+    if garch_cache:
+        fits = GarchFitCache().fit_all(returns, label=ticker)
+    else:
+        fits = fit_all(returns)
+    print(fit_summary(fits).to_string(), "\n")
+
+    if garch_oos:
+        # Genuine one-step-ahead forecasts (no look-ahead) for VaR & plots
+        print("Rolling out-of-sample GARCH re-estimation...\n")
+        sigmas = {
+            name: rolling_garch_forecast(returns, spec)[0]
+            for name, spec in MODEL_REGISTRY.items()
+        }
+    else:
+        sigmas = {name: fit.conditional_vol for name, fit in fits.items()}
+
+    sigmas = {
+        name: sigma.reindex(rv.index).dropna().rename(name)
+        for name, sigma in sigmas.items()
+    }
+    garch_sigma   = sigmas["garch"]
+    egarch_sigma  = sigmas["egarch"]
+    tgarch_sigma  = sigmas["tgarch"]
+    garch_t_sigma = sigmas["garch_t"]
 
     # =================================================
     # 5. ML VOLATILITY (WALK-FORWARD)
@@ -124,10 +207,15 @@ def main():
         ml_data, model_type="xgb"
     )
 
+    # HAR-RV benchmark (same windows, rank-one OLS updates)
+    har_data = create_har_features(returns_df, rv)
+    har_preds, _, har_rmse = walk_forward_har_forecast(har_data)
+
     print("ML MODEL PERFORMANCE")
     print("-------------------")
     print(f"Random Forest RMSE : {rf_rmse:.6f}")
     print(f"XGBoost RMSE       : {xgb_rmse:.6f}")
+    print(f"HAR-RV RMSE        : {har_rmse:.6f}")
 
     # =================================================
     # 6. PARAMETRIC VAR (99%)
@@ -149,9 +237,14 @@ def main():
     _, garch_t_rate = var_breaches(r_gt, v_gt)
 
     # ---- ML Student-t ----
+    # Feature row t (returns up to t) forecasts day t+1, so each forecast
+    # is indexed at the next trading date (one-step-ahead, no look-ahead).
+    # The HAR series below is aligned the same way, so the breach rates
+    # are comparable.
+    ml_origins = ml_data.index[-len(xgb_preds):]
     ml_sigma_raw = pd.Series(
         xgb_preds,
-        index=rv.index[-len(xgb_preds):]
+        index=returns.index[returns.index.get_indexer(ml_origins) + 1]
     )
 
     ml_sigma_cal = calibrate_volatility(
@@ -166,11 +259,31 @@ def main():
     r_ml, v_ml = returns.align(var_ml, join="inner")
     ml_breaches, ml_rate = var_breaches(r_ml, v_ml)
 
+    # ---- HAR-RV Student-t ----
+    # Same alignment as the ML forecasts: row t predicts day t+1
+    har_origins = har_data.index[-len(har_preds):]
+    har_sigma_raw = pd.Series(
+        har_preds,
+        index=returns.index[returns.index.get_indexer(har_origins) + 1]
+    )
+
+    har_sigma_cal = calibrate_volatility(
+        returns.loc[har_sigma_raw.index],
+        har_sigma_raw
+    )
+
+    _, var_har, _ = parametric_var_cvar(
+        returns, har_sigma_cal, alpha, dist="t", nu=8
+    )
+    r_har, v_har = returns.align(var_har, join="inner")
+    _, har_rate = var_breaches(r_har, v_har)
+
     print("\nVaR BACKTEST RESULTS (99%)")
     print("-------------------------")
     print(f"GARCH (Gaussian)   : {garch_rate:.4f}")
     print(f"GARCH (Student-t)  : {garch_t_rate:.4f}")
     print(f"ML (Calibrated-t)  : {ml_rate:.4f}")
+    print(f"HAR (Calibrated-t) : {har_rate:.4f}")
     print(f"Expected           : {1 - alpha:.4f}")
 
     # Save VaR summary
@@ -179,6 +292,7 @@ def main():
         f.write(f"GARCH Gaussian   : {garch_rate:.4f}\n")
         f.write(f"GARCH Student-t  : {garch_t_rate:.4f}\n")
         f.write(f"ML Student-t     : {ml_rate:.4f}\n")
+        f.write(f"HAR Student-t    : {har_rate:.4f}\n")
         f.write(f"Expected         : {1-alpha:.4f}\n")
 
     # =================================================
@@ -196,7 +310,13 @@ def main():
     # 8. VOLATILITY COMPARISON PLOT
     # =================================================
     plt.figure()
-    plt.plot(rv.index, rv["realized_vol"], color="black", linewidth=2, label="Realized Vol")
+    plt.plot(
+        benchmark.index,
+        benchmark["realized_vol"],
+        color="black",
+        linewidth=2,
+        label=benchmark_label
+    )
     plt.plot(garch_sigma, label="GARCH(1,1)")
     plt.plot(egarch_sigma, label="EGARCH(1,1)")
     plt.plot(tgarch_sigma, label="TGARCH(1,1)")
@@ -290,4 +410,49 @@ def main():
 # ENTRY POINT
 # =================================================
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Volatility & risk analytics pipeline")
+    parser.add_argument("--ticker", default="SPY")
+    parser.add_argument(
+        "--source",
+        default="yfinance",
+        choices=sorted(PRICE_SOURCES),
+        help="price source (file/synthetic run without network access)"
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=None,
+        help="directory for --source file (default: data/raw)"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=None,
+        help="cache downloaded prices on disk for this many hours"
+    )
+    parser.add_argument(
+        "--benchmark-vol",
+        default="close",
+        choices=["close", *RANGE_ESTIMATORS],
+        help="realized-vol benchmark for the GARCH comparison (range estimators need OHLC data)"
+    )
+    parser.add_argument(
+        "--garch-oos",
+        action="store_true",
+        help="use rolling out-of-sample GARCH forecasts instead of in-sample fits"
+    )
+    parser.add_argument(
+        "--no-garch-cache",
+        action="store_true",
+        help="refit every GARCH model instead of reusing cached fits"
+    )
+    args = parser.parse_args()
+
+    main(
+        ticker=args.ticker,
+        source=args.source,
+        data_dir=args.data_dir,
+        cache_ttl=args.cache_ttl,
+        benchmark_vol=args.benchmark_vol,
+        garch_oos=args.garch_oos,
+        garch_cache=not args.no_garch_cache
+    )
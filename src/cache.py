@@ -0,0 +1,146 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# -------------------------------------------------------------------
+# Paths
+# -------------------------------------------------------------------
+CACHE_ROOT = Path("data/cache")
+CACHE_SUFFIX = ".pkl"
+
+
+class DiskCache:
+    """
+    Content-keyed on-disk cache with TTL expiry and size-bounded LRU eviction.
+
+    Each entry is one pickle file named by the SHA-256 of its key. An
+    entry's mtime is bumped on every hit, so eviction (oldest mtime first,
+    until the cache fits in `max_bytes`) is least-recently-used. Entries
+    older than `ttl` seconds (measured from when they were written) are
+    treated as misses and removed.
+
+    Hit/miss/expiry/eviction counters are kept in memory for
+    instrumentation, see ``stats()``. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        root: Path = CACHE_ROOT,
+        ttl: float = None,
+        max_bytes: int = 512 * 1024 ** 2
+    ):
+        self.root = Path(root)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    # ---------------------------------------------------------------
+    # Keys
+    # ---------------------------------------------------------------
+    @staticmethod
+    def make_key(*parts) -> str:
+        """
+        Stable digest of the repr of `parts`.
+        """
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}{CACHE_SUFFIX}"
+
+    # ---------------------------------------------------------------
+    # Access
+    # ---------------------------------------------------------------
+    def get(self, key: str, default=None):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                created, value = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            with self._lock:
+                self.misses += 1
+            return default
+
+        if self.ttl is not None and time.time() - created > self.ttl:
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.expired += 1
+                self.misses += 1
+            return default
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((time.time(), value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self._path(key))
+        self.evict()
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    # ---------------------------------------------------------------
+    # Maintenance
+    # ---------------------------------------------------------------
+    def _entries(self):
+        entries = []
+        for path in self.root.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def evict(self) -> int:
+        """
+        Drop least-recently-used entries until the cache fits in max_bytes.
+        """
+        if self.max_bytes is None:
+            return 0
+
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        with self._lock:
+            self.evictions += removed
+        return removed
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> dict:
+        entries = self._entries()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+        }
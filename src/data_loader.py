@@ -1,58 +1,280 @@
-import yfinance as yf
+import random
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+from src.price_csv import read_price_csv
+from src.price_sources import (
+    FIELDS,
+    PriceSource,
+    RateLimiter,
+    TransientFetchError,
+    YFinanceSource,
+    field_columns
+)
+from src.price_store import (
+    STORE_ROOT,
+    last_stored_date,
+    partition_path,
+    read_prices,
+    write_prices
+)
+
 # -------------------------------------------------------------------
 # Paths
 # -------------------------------------------------------------------
 DATA_RAW = Path("data/raw")
+DATA_STORE = STORE_ROOT
 
 
 # -------------------------------------------------------------------
 # Data Download
 # -------------------------------------------------------------------
 def download_price_data(
-    ticker: str,
+    ticker,
     start: str = "2005-01-01",
-    end: str = None
+    end: str = None,
+    source: PriceSource = None,
+    fields: str = "price",
+    **batch_kwargs
 ) -> pd.DataFrame:
     """
     Download daily market price data and return a clean price series.
 
-    Robust to:
-    - MultiIndex columns (new yfinance behavior)
-    - Missing 'Adj Close' (falls back to 'Close')
+    Parameters
+    ----------
+    ticker : str or list of str
+        A list of tickers is fetched concurrently via download_price_batch
+        and returned as a wide panel; tickers that failed are listed in
+        ``panel.attrs["failed"]`` instead of raising.
+    source : PriceSource, optional
+        Where prices come from (default: yfinance). Pass a FileSource or
+        SyntheticSource to run without network access.
+    fields : str
+        'price' (adjusted close only) or 'ohlcv' (adjusted open/high/low/
+        close plus volume, from the same single request).
+    **batch_kwargs
+        Forwarded to download_price_batch for list input.
 
     Returns:
-        pd.DataFrame with a single column: ['price']
+        pd.DataFrame with a single column: ['price'], or
+        ['price', 'open', 'high', 'low', 'volume'] for fields='ohlcv'
+        (one price column per ticker for list input)
     """
-    df = yf.download(
-        ticker,
-        start=start,
-        end=end,
-        auto_adjust=False,
-        progress=False
-    )
+    if source is None:
+        source = YFinanceSource()
 
-    if df.empty:
+    if not isinstance(ticker, str):
+        batch = download_price_batch(
+            ticker, start=start, end=end, source=source, **batch_kwargs
+        )
+        panel = batch.prices
+        panel.attrs["failed"] = batch.failed
+        return panel
+
+    price = source.fetch(ticker, start=start, end=end, fields=fields)
+
+    if price.empty:
         raise ValueError(f"No data returned for ticker {ticker}")
 
-    # Handle MultiIndex columns (yfinance >= 0.2.x)
-    if isinstance(df.columns, pd.MultiIndex):
-        df.columns = df.columns.get_level_values(0)
+    price = price.dropna()
+
+    return price
+
+
+# -------------------------------------------------------------------
+# Batch Download
+# -------------------------------------------------------------------
+# Errors that will not go away on retry (no data, unknown file).
+NON_RETRYABLE = (ValueError, FileNotFoundError)
+
+
+@dataclass
+class BatchDownload:
+    """
+    Outcome of a multi-ticker download.
+
+    prices    : wide DataFrame (dates x succeeded tickers), outer-aligned
+    succeeded : tickers that returned data, in request order
+    failed    : ticker -> error message
+    """
+    prices: pd.DataFrame
+    succeeded: list = field(default_factory=list)
+    failed: dict = field(default_factory=dict)
+
+
+def _fetch_with_retry(ticker, start, end, source, limiter, retries, backoff, fields="price"):
+    for attempt in range(retries + 1):
+        limiter.acquire()
+        try:
+            return download_price_data(ticker, start=start, end=end, source=source, fields=fields)
+        except NON_RETRYABLE:
+            raise
+        except Exception:
+            if attempt == retries:
+                raise
+            # Exponential backoff with jitter so workers do not retry in lockstep
+            time.sleep(backoff * 2 ** attempt + random.uniform(0, backoff))
+
+
+def download_price_batch(
+    tickers: list,
+    start: str = "2005-01-01",
+    end: str = None,
+    source: PriceSource = None,
+    max_workers: int = 8,
+    retries: int = 3,
+    backoff: float = 0.5,
+    rate_limit: float = None
+) -> BatchDownload:
+    """
+    Fetch many tickers concurrently on a bounded thread pool.
 
-    # Prefer Adjusted Close, fallback to Close
-    if "Adj Close" in df.columns:
-        price = df["Adj Close"]
-    elif "Close" in df.columns:
-        price = df["Close"]
+    Each ticker is retried with exponential backoff on transient errors
+    (TransientFetchError and other unexpected exceptions); confirmed
+    empty results and missing files fail immediately. All workers share
+    one rate limiter (`rate_limit` fetches/sec, default: the source's own
+    limit). Failures are collected per ticker rather than raised.
+    """
+    if source is None:
+        source = YFinanceSource()
+
+    limiter = RateLimiter(rate_limit if rate_limit is not None else source.rate_limit)
+    tickers = list(dict.fromkeys(tickers))
+
+    results = {}
+    failed = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tickers) or 1))) as pool:
+        futures = {
+            pool.submit(
+                _fetch_with_retry, t, start, end, source, limiter, retries, backoff
+            ): t
+            for t in tickers
+        }
+        for future, ticker in futures.items():
+            try:
+                results[ticker] = future.result()["price"]
+            except Exception as exc:
+                failed[ticker] = f"{type(exc).__name__}: {exc}"
+
+    succeeded = [t for t in tickers if t in results]
+    if succeeded:
+        prices = pd.concat({t: results[t] for t in succeeded}, axis=1).sort_index()
     else:
-        raise ValueError("Neither 'Adj Close' nor 'Close' found in data")
+        prices = pd.DataFrame()
 
-    price = price.to_frame(name="price")
-    price.dropna(inplace=True)
+    return BatchDownload(prices=prices, succeeded=succeeded, failed=failed)
 
-    return price
+
+# -------------------------------------------------------------------
+# Incremental Refresh
+# -------------------------------------------------------------------
+def refresh_price_data(
+    ticker: str,
+    start: str = "2005-01-01",
+    overlap: int = 5,
+    root: Path = DATA_STORE,
+    rtol: float = 1e-6,
+    source: PriceSource = None,
+    fields: str = "price",
+    retries: int = 3,
+    backoff: float = 0.5
+) -> pd.DataFrame:
+    """
+    Bring a ticker's store partition up to date and return the full history.
+
+    Only bars from `overlap` stored bars back onwards are downloaded. The
+    overlapping bars are compared against the stored ones: if any moved
+    (a late correction, or a dividend/split back-adjustment of Adj Close),
+    the full history is re-downloaded instead of appended. The partition
+    is rewritten atomically either way.
+
+    A partition keeps the widest field set it already holds: once it has
+    OHLCV columns it is refreshed as OHLCV and projected to `fields`, so
+    a 'price' run never discards them. A partition that lacks the
+    requested columns is re-downloaded with them.
+
+    Downloads are retried like batch downloads (`retries`, `backoff`).
+    If a partition exists and the source still fails transiently, the
+    stored history is returned with a warning instead of raising.
+
+    Returns:
+        pd.DataFrame with the columns of download_price_data(fields=...)
+    """
+    if source is None:
+        source = YFinanceSource()
+    limiter = RateLimiter(source.rate_limit)
+
+    def fetch(since):
+        return _fetch_with_retry(ticker, since, None, source, limiter, retries, backoff, fields)
+
+    last_date = last_stored_date(ticker, root)
+    if last_date is None:
+        prices = fetch(start)
+        write_prices(prices, ticker, root)
+        return prices
+
+    stored = read_prices(ticker, root=root)
+    columns = field_columns(fields)
+    fields = _stored_fields(stored.columns, fields)
+    fetch_from = stored.index[max(len(stored) - overlap, 0)]
+
+    try:
+        fresh = fetch(fetch_from.strftime("%Y-%m-%d"))
+    except ValueError:
+        # Nothing new (weekend, holiday, or source lagging)
+        return stored[columns]
+    except TransientFetchError as exc:
+        if not set(columns) <= set(stored.columns):
+            raise
+        warnings.warn(f"{ticker}: refresh failed ({exc}); using stored prices up to {last_date:%Y-%m-%d}")
+        return stored[columns]
+
+    common = stored.index.intersection(fresh.index)
+    consistent = (
+        len(common) > 0
+        and list(stored.columns) == list(fresh.columns)
+        and np.allclose(
+            stored.loc[common].to_numpy(),
+            fresh.loc[common].to_numpy(),
+            rtol=rtol,
+            atol=0.0
+        )
+    )
+
+    if consistent:
+        new_bars = fresh.loc[fresh.index > last_date]
+        if new_bars.empty:
+            return stored[columns]
+        prices = pd.concat([stored, new_bars])
+    else:
+        try:
+            prices = fetch(start)
+        except TransientFetchError as exc:
+            if not set(columns) <= set(stored.columns):
+                raise
+            warnings.warn(f"{ticker}: full re-download failed ({exc}); using stored prices up to {last_date:%Y-%m-%d}")
+            return stored[columns]
+
+    write_prices(prices, ticker, root)
+    return prices[columns]
+
+
+def _stored_fields(stored_columns, fields: str) -> str:
+    """
+    The widest registered field set that covers `fields` and whose
+    columns are all already stored (`fields` itself if there is none).
+    """
+    wanted = set(field_columns(fields))
+    have = set(stored_columns)
+    covering = [f for f, cols in FIELDS.items() if wanted <= set(cols) <= have]
+    return max(covering, key=lambda f: len(FIELDS[f]), default=fields)
 
 
 # -------------------------------------------------------------------
@@ -60,17 +282,36 @@ def download_price_data(
 # -------------------------------------------------------------------
 def save_raw_data(df: pd.DataFrame, filename: str) -> None:
     """
-    Save raw data to data/raw directory.
+    Save raw data to the columnar store (data/store).
+
+    The partition is named after the file stem, so
+    ``save_raw_data(df, "spy_prices.csv")`` writes ``data/store/spy_prices.arrow``.
     """
-    DATA_RAW.mkdir(parents=True, exist_ok=True)
-    df.to_csv(DATA_RAW / filename)
+    write_prices(df, Path(filename).stem, DATA_STORE)
 
 
-def load_raw_data(filename: str) -> pd.DataFrame:
+def load_raw_data(
+    filename: str,
+    columns: list = None,
+    start: str = None,
+    end: str = None,
+    dtype: str = "float64",
+    chunksize: int = None
+) -> pd.DataFrame:
     """
-    Load raw data from data/raw directory.
+    Load raw data, preferring the columnar store over legacy CSV.
+
+    Reads the memory-mapped partition for the file stem when it exists,
+    otherwise parses the CSV in data/raw with an explicit schema (see
+    read_price_csv; `dtype` and `chunksize` apply to this path only).
+    Column and date-range projection apply to both paths.
     """
+    name = Path(filename).stem
+    if partition_path(name, DATA_STORE).exists():
+        return read_prices(name, columns=columns, start=start, end=end, root=DATA_STORE)
+
     filepath = DATA_RAW / filename
     if not filepath.exists():
-        raise FileNotFoundError(f"{filename} not found in data/raw/")
-    return pd.read_csv(filepath, index_col=0, parse_dates=True)
+        raise FileNotFoundError(f"{filename} not found in data/store/ or data/raw/")
+    df = read_price_csv(filepath, dtype=dtype, chunksize=chunksize, columns=columns)
+    return df.loc[start:end]
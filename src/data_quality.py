@@ -0,0 +1,136 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.price_panel import PricePanel
+
+# -------------------------------------------------------------------
+# Thresholds
+# -------------------------------------------------------------------
+MAX_GAP_BDAYS = 5          # more missing business days than this is a gap
+STALE_RUN = 5              # identical consecutive prices that count as stale
+SPLIT_RATIOS = (2.0, 3.0, 4.0, 5.0, 10.0, 1.5, 20.0)
+SPLIT_TOL = 0.05           # relative tolerance around a split ratio
+SPLIT_MIN_MOVE = np.log(1.4)
+
+CHECKS = ["non_positive", "duplicate_date", "calendar_gap", "stale", "split_jump"]
+
+
+def scan_price_panel(
+    panel,
+    max_gap_bdays: int = MAX_GAP_BDAYS,
+    stale_run: int = STALE_RUN,
+    split_tol: float = SPLIT_TOL
+) -> pd.DataFrame:
+    """
+    Flag suspicious prints across a whole price panel in one vectorized sweep.
+
+    Checks (each a whole-matrix NumPy pass, no per-ticker loop):
+
+    - non_positive   : price <= 0
+    - duplicate_date : date appears more than once in the index
+    - calendar_gap   : more than `max_gap_bdays` business days since the
+                       ticker's previous observation
+    - stale          : at least `stale_run` identical consecutive prices
+    - split_jump     : one-day price ratio within `split_tol` of a common
+                       split ratio (2:1, 3:1, ..., or the reverse)
+
+    Parameters
+    ----------
+    panel : PricePanel or pd.DataFrame (dates x tickers)
+        Duplicate dates can only be detected from a DataFrame, since a
+        PricePanel index is unique by construction.
+
+    Returns
+    -------
+    pd.DataFrame with one row per flagged (date, ticker, check) and the
+    offending price; empty if the data is clean.
+    """
+    if isinstance(panel, PricePanel):
+        values, dates, tickers = panel.values, panel.dates, list(panel.tickers)
+    else:
+        values = panel.to_numpy(dtype=np.float64)
+        dates, tickers = pd.DatetimeIndex(panel.index), list(panel.columns)
+
+    n_dates, n_tickers = values.shape
+    observed = ~np.isnan(values)
+    flags = {}
+
+    # ---- Zero / negative prints ----
+    with np.errstate(invalid="ignore"):
+        flags["non_positive"] = observed & (values <= 0)
+
+    # ---- Duplicated dates (index-level, broadcast to observed cells) ----
+    dup = dates.duplicated(keep=False)
+    flags["duplicate_date"] = observed & dup[:, None]
+
+    # ---- Calendar gaps: business days since the previous observation ----
+    bday = np.busday_count(
+        dates.values.astype("datetime64[D]").min(),
+        dates.values.astype("datetime64[D]")
+    )
+    last_seen = np.where(observed, bday[:, None], -1)
+    last_seen = np.maximum.accumulate(last_seen, axis=0)
+    prev_seen = np.vstack([np.full((1, n_tickers), -1), last_seen[:-1]])
+    flags["calendar_gap"] = (
+        observed & (prev_seen >= 0) & (bday[:, None] - prev_seen > max_gap_bdays)
+    )
+
+    # ---- Forward-fill along time for return-based checks ----
+    idx = np.where(observed, np.arange(n_dates)[:, None], 0)
+    idx = np.maximum.accumulate(idx, axis=0)
+    filled = np.take_along_axis(values, idx, axis=0)
+    prev = np.vstack([np.full((1, n_tickers), np.nan), filled[:-1]])
+
+    # ---- Stale repeats: run length of unchanged prices ----
+    same = observed & (values == prev)
+    run_start = np.where(~same, np.arange(n_dates)[:, None], 0)
+    run_start = np.maximum.accumulate(run_start, axis=0)
+    run_len = np.arange(n_dates)[:, None] - run_start + 1
+    flags["stale"] = same & (run_len >= stale_run)
+
+    # ---- Split-like jumps ----
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_move = np.abs(np.log(values / prev))
+    ratios = np.log(np.asarray(SPLIT_RATIOS))
+    near_split = np.zeros_like(observed)
+    for r in ratios:
+        near_split |= np.abs(log_move - r) <= np.log1p(split_tol)
+    flags["split_jump"] = observed & (log_move >= SPLIT_MIN_MOVE) & near_split
+
+    # ---- Collect flagged cells ----
+    records = []
+    for check in CHECKS:
+        rows, cols = np.nonzero(flags[check])
+        if len(rows):
+            records.append(pd.DataFrame({
+                "date": dates[rows],
+                "ticker": np.asarray(tickers, dtype=object)[cols],
+                "check": check,
+                "price": values[rows, cols],
+            }))
+
+    if not records:
+        return pd.DataFrame(columns=["date", "ticker", "check", "price"])
+    return pd.concat(records, ignore_index=True).sort_values(["ticker", "date", "check"])
+
+
+def summarize_quality(report: pd.DataFrame, tickers=None) -> pd.DataFrame:
+    """
+    Compact ticker x check count table from a scan report.
+    """
+    table = pd.crosstab(report["ticker"], report["check"]).reindex(columns=CHECKS, fill_value=0)
+    if tickers is not None:
+        table = table.reindex(list(tickers), fill_value=0)
+    table.index.name = "ticker"
+    return table
+
+
+def write_quality_report(report: pd.DataFrame, path: Path) -> None:
+    """
+    Write the flagged-cell report (compact CSV, one line per flag).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report.to_csv(path, index=False)
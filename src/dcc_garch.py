@@ -0,0 +1,262 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import minimize
+from scipy.signal import lfilter
+
+from src.garch_models import MODEL_REGISTRY, GarchSpec, fit_spec, run_parallel
+
+# -------------------------------------------------------------------
+# DCC-GARCH (Engle 2002) with packed upper-triangular storage
+# -------------------------------------------------------------------
+# 1. Univariate GARCH per asset (process pool)    -> sigma_t, z_t
+# 2. Q_t = (1 - a - b) S + a z_{t-1} z_{t-1}' + b Q_{t-1},  S = corr(z)
+#    R_t = diag(Q_t)^-1/2 Q_t diag(Q_t)^-1/2
+# 3. H_t = D_t R_t D_t,  D_t = diag(sigma_t)
+#
+# Every N x N matrix is stored as its packed upper triangle (row-major
+# np.triu_indices order, N (N + 1) / 2 entries), so a (dates x packed)
+# array holds the whole path. The Q recursion is linear with a scalar
+# coefficient b, so it runs as one scipy lfilter over all packed entries
+# at once, in blocks of dates to bound the temporary memory.
+#
+# (a, b) are estimated by composite likelihood over contiguous pairs
+# (Engle, Shephard & Sheppard 2008): each pair's bivariate correlation
+# likelihood needs only three entries of Q, which keeps estimation
+# O(N) per likelihood evaluation instead of O(N^3).
+
+MAX_PERSISTENCE = 0.999
+
+
+def packed_index(n: int):
+    """
+    Row / column indices of the packed upper triangle of an n x n matrix.
+    """
+    return np.triu_indices(n)
+
+
+def unpack(packed: np.ndarray, n: int) -> np.ndarray:
+    """
+    Full symmetric matrix (or stack of matrices) from packed triangle(s).
+    """
+    packed = np.asarray(packed)
+    iu, ju = packed_index(n)
+    out = np.zeros(packed.shape[:-1] + (n, n), dtype=packed.dtype)
+    out[..., iu, ju] = packed
+    out[..., ju, iu] = packed
+    return out
+
+
+def _diag_positions(n: int) -> np.ndarray:
+    """
+    Positions of the diagonal entries inside a packed upper triangle.
+    """
+    i = np.arange(n)
+    return i * n - i * (i - 1) // 2
+
+
+def _lagged_products(z, cols, target, lo=0, hi=None):
+    """
+    z_{t-1,i} z_{t-1,j} for dates lo..hi-1 and packed entries `cols`
+    (= (rows, cols) index arrays); the pre-sample product is `target`.
+    """
+    i, j = cols
+    hi = len(z) if hi is None else hi
+    prev = z[max(lo - 1, 0):hi - 1]
+    zz = prev[:, i] * prev[:, j]
+    if lo == 0:
+        zz = np.vstack([target[None, :], zz])
+    return zz
+
+
+def _q_filter(zz_lag, target, a, b, zi=None):
+    """
+    Q_t = (1 - a - b) S + a zz_lag_t + b Q_{t-1} along axis 0.
+
+    zi=None starts from Q_{-1} = S; pass the returned state to continue
+    the recursion in the next block of dates.
+    """
+    x = (1 - a - b) * target + a * zz_lag
+    zi = b * target[None, :] if zi is None else zi
+    return lfilter([1.0], [1.0, -b], x, axis=0, zi=zi)
+
+
+# -------------------------------------------------------------------
+# Step 1: univariate fits
+# -------------------------------------------------------------------
+def fit_univariate(
+    returns: pd.DataFrame,
+    spec: GarchSpec = MODEL_REGISTRY["garch"],
+    n_workers: int = None,
+    engine: str = "arch"
+):
+    """
+    One univariate GARCH per column in a process pool.
+
+    Returns
+    -------
+    sigma : pd.DataFrame
+        Conditional volatility (decimal), dates x assets.
+    z : pd.DataFrame
+        Standardized residuals (r - mu) / sigma.
+    """
+    fits = run_parallel(fit_spec, [(returns[c], spec, engine) for c in returns.columns], n_workers)
+
+    sigma = pd.concat([f.conditional_vol.rename(c) for c, f in zip(returns.columns, fits)], axis=1)
+    mu = pd.Series([f.params.get("mu", 0.0) / 100 for f in fits], index=returns.columns)
+    z = (returns - mu) / sigma
+    return sigma, z
+
+
+# -------------------------------------------------------------------
+# Step 2: correlation dynamics
+# -------------------------------------------------------------------
+def composite_loglikelihood(params, z: np.ndarray, target: np.ndarray) -> float:
+    """
+    Sum over contiguous pairs (i, i + 1) of the bivariate DCC
+    correlation log-likelihood.
+    """
+    a, b = params
+    n = z.shape[1]
+    i = np.arange(n - 1)
+    diag = _diag_positions(n)
+    off = diag[:-1] + 1                     # packed position of (i, i + 1)
+
+    rows = np.concatenate([i, i, i + 1])
+    cols = np.concatenate([i + 1, i, i + 1])
+    pos = np.concatenate([off, diag[:-1], diag[1:]])
+
+    q, _ = _q_filter(_lagged_products(z, (rows, cols), target[pos]), target[pos], a, b)
+    q12, q11, q22 = np.split(q, 3, axis=1)
+    rho = q12 / np.sqrt(q11 * q22)
+
+    z1, z2 = z[:, i], z[:, i + 1]
+    one_minus = 1 - rho * rho
+    ll = np.log(one_minus) + (z1 * z1 + z2 * z2 - 2 * rho * z1 * z2) / one_minus
+    return float(-0.5 * ll.sum())
+
+
+def estimate_dcc(z: np.ndarray, start=(0.02, 0.95)):
+    """
+    Composite-likelihood estimates of (a, b) with a, b >= 0 and
+    a + b <= MAX_PERSISTENCE. Returns (a, b, target) where target is
+    the packed sample correlation of z.
+    """
+    n = z.shape[1]
+    if n < 2:
+        raise ValueError("DCC needs at least two assets")
+
+    iu, ju = packed_index(n)
+    target = (z[:, iu] * z[:, ju]).mean(axis=0)
+    sd = np.sqrt(target[_diag_positions(n)])
+    target = target / (sd[iu] * sd[ju])
+
+    res = minimize(
+        lambda p: -composite_loglikelihood(p, z, target),
+        np.asarray(start, dtype=np.float64),
+        method="SLSQP",
+        bounds=[(0.0, MAX_PERSISTENCE), (0.0, MAX_PERSISTENCE)],
+        constraints=[{"type": "ineq", "fun": lambda p: MAX_PERSISTENCE - p[0] - p[1]}]
+    )
+    a, b = res.x
+    return float(a), float(b), target
+
+
+# -------------------------------------------------------------------
+# Step 3: time-varying correlations / covariances
+# -------------------------------------------------------------------
+@dataclass
+class DCCResult:
+    """
+    Fitted DCC-GARCH. `correlation` and `covariance` are (dates x packed)
+    arrays, one packed upper triangle per date (see unpack).
+    """
+    a: float
+    b: float
+    assets: pd.Index
+    dates: pd.Index
+    sigma: pd.DataFrame
+    correlation: np.ndarray
+    covariance: np.ndarray
+
+    def covariance_matrix(self, date) -> pd.DataFrame:
+        t = self.dates.get_loc(date)
+        return pd.DataFrame(unpack(self.covariance[t], len(self.assets)), index=self.assets, columns=self.assets)
+
+    def correlation_matrix(self, date) -> pd.DataFrame:
+        t = self.dates.get_loc(date)
+        return pd.DataFrame(unpack(self.correlation[t], len(self.assets)), index=self.assets, columns=self.assets)
+
+    def portfolio_volatility(self, weights) -> pd.Series:
+        """
+        sqrt(w' H_t w) for every date, straight from the packed triangles.
+        """
+        if isinstance(weights, (dict, pd.Series)):
+            weights = pd.Series(weights).reindex(self.assets).fillna(0.0)
+        w = np.asarray(weights, dtype=np.float64)
+        iu, ju = packed_index(len(w))
+        coef = w[iu] * w[ju] * np.where(iu == ju, 1.0, 2.0)
+        var = self.covariance @ coef.astype(self.covariance.dtype)
+        return pd.Series(np.sqrt(var), index=self.dates, name="portfolio_vol")
+
+
+def dcc_paths(z, sigma, a, b, target, dtype=np.float64, block_cells: int = 2_000_000):
+    """
+    Packed correlation and covariance paths, computed in blocks of
+    dates of at most `block_cells` packed values (the Q filter state
+    carries across blocks).
+    """
+    T, n = z.shape
+    iu, ju = packed_index(n)
+    diag = _diag_positions(n)
+    m = len(iu)
+    block = max(1, block_cells // m)
+
+    corr = np.empty((T, m), dtype=dtype)
+    cov = np.empty((T, m), dtype=dtype)
+
+    zi = None
+    for lo in range(0, T, block):
+        hi = min(lo + block, T)
+        q, zi = _q_filter(_lagged_products(z, (iu, ju), target, lo, hi), target, a, b, zi)
+
+        sd = np.sqrt(q[:, diag])
+        r = q / (sd[:, iu] * sd[:, ju])
+        s = sigma[lo:hi]
+        corr[lo:hi] = r
+        cov[lo:hi] = r * s[:, iu] * s[:, ju]
+
+    return corr, cov
+
+
+def fit_dcc(
+    returns: pd.DataFrame,
+    spec: GarchSpec = MODEL_REGISTRY["garch"],
+    n_workers: int = None,
+    engine: str = "arch",
+    dtype=np.float64
+) -> DCCResult:
+    """
+    Two-step DCC-GARCH on a returns panel (dates x assets).
+
+    Rows with any missing return are dropped so every asset shares one
+    calendar. dtype=np.float32 halves the memory of the packed paths
+    (N (N + 1) / 2 values per date each), e.g. for a few hundred assets.
+    """
+    returns = returns.dropna(how="any")
+    sigma, z = fit_univariate(returns, spec, n_workers, engine)
+
+    z_arr = z.to_numpy(dtype=np.float64)
+    a, b, target = estimate_dcc(z_arr)
+    corr, cov = dcc_paths(z_arr, sigma.to_numpy(dtype=np.float64), a, b, target, dtype)
+
+    return DCCResult(
+        a=a,
+        b=b,
+        assets=returns.columns,
+        dates=returns.index,
+        sigma=sigma,
+        correlation=corr,
+        covariance=cov
+    )
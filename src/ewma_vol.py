@@ -0,0 +1,137 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+RISKMETRICS_LAMBDA = 0.94
+
+
+class EWMAVolatility:
+    """
+    Online EWMA (RiskMetrics) volatility.
+
+    sigma^2_{t+1} = lam * sigma^2_t + (1 - lam) * r_t^2
+
+    `update` is O(1), so the estimator can follow a live return stream
+    without refitting. `sigma` is the one-step-ahead daily volatility
+    forecast given all returns seen so far. The state is two floats plus
+    a counter and round-trips through to_dict / save / load.
+    """
+
+    def __init__(self, lam: float = RISKMETRICS_LAMBDA, variance: float = None, n_obs: int = 0):
+        if not 0.0 < lam < 1.0:
+            raise ValueError("lam must be in (0, 1)")
+        self.lam = lam
+        self.variance = variance
+        self.n_obs = n_obs
+
+    # ---------------------------------------------------------------
+    # Seeding
+    # ---------------------------------------------------------------
+    @classmethod
+    def from_returns(cls, returns, lam: float = RISKMETRICS_LAMBDA) -> "EWMAVolatility":
+        """
+        Seed from history: start at the sample variance of the first
+        min(len, 30) returns, then run the recursion over the rest.
+        """
+        r = np.asarray(returns, dtype=np.float64)
+        r = r[~np.isnan(r)]
+        if len(r) == 0:
+            raise ValueError("need at least one return to seed")
+
+        state = cls(lam, variance=float(np.mean(r[:30] ** 2)))
+        variance = ewma_variance(r, lam, seed=state.variance)
+        state.variance = float(variance[-1])
+        state.n_obs = len(r)
+        return state
+
+    # ---------------------------------------------------------------
+    # Online update
+    # ---------------------------------------------------------------
+    def update(self, r: float) -> float:
+        """
+        Absorb one return; returns the new volatility forecast.
+        """
+        if np.isnan(r):
+            return self.sigma
+        if self.variance is None:
+            self.variance = r * r
+        else:
+            self.variance = self.lam * self.variance + (1.0 - self.lam) * r * r
+        self.n_obs += 1
+        return self.sigma
+
+    @property
+    def sigma(self) -> float:
+        return float(np.sqrt(self.variance)) if self.variance is not None else np.nan
+
+    # ---------------------------------------------------------------
+    # Persistence
+    # ---------------------------------------------------------------
+    def to_dict(self) -> dict:
+        return {"lam": self.lam, "variance": self.variance, "n_obs": self.n_obs}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "EWMAVolatility":
+        return cls(d["lam"], d["variance"], d["n_obs"])
+
+    def save(self, path: Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict()))
+
+    @classmethod
+    def load(cls, path: Path) -> "EWMAVolatility":
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+    def __repr__(self) -> str:
+        return f"EWMAVolatility(lam={self.lam}, sigma={self.sigma:.6g}, n_obs={self.n_obs})"
+
+
+# -------------------------------------------------------------------
+# Batch (whole history, whole panel)
+# -------------------------------------------------------------------
+def ewma_variance(returns, lam: float = RISKMETRICS_LAMBDA, seed=None) -> np.ndarray:
+    """
+    EWMA variance after each return, vectorized along time with a linear
+    filter (axis 0), so a (n_dates, n_assets) array is processed in one call.
+
+    Element t is the forecast for t+1 given returns up to t -- the same
+    value EWMAVolatility holds after update(r_t). `seed` is the variance
+    before the first return (default: first squared return).
+    """
+    r2 = np.square(np.asarray(returns, dtype=np.float64))
+    if seed is None:
+        seed = r2[0]
+    seed = np.broadcast_to(np.asarray(seed, dtype=np.float64), r2.shape[1:])
+
+    zi = (lam * seed)[np.newaxis, ...]
+    out, _ = lfilter([1.0 - lam], [1.0, -lam], r2, axis=0, zi=zi)
+    return out
+
+
+def ewma_volatility(returns, lam: float = RISKMETRICS_LAMBDA) -> pd.DataFrame:
+    """
+    EWMA volatility forecasts for a return series or panel.
+
+    Parameters
+    ----------
+    returns : pd.DataFrame
+        Single-column ['log_return'] frame or wide panel (dates x assets).
+        NaNs are not supported by the filter; drop or fill them first.
+
+    Returns
+    -------
+    pd.DataFrame of one-step-ahead volatility, shifted so the value on
+    date t uses returns up to t-1 (directly usable as a VaR sigma). The
+    single-series column is named 'ewma'.
+    """
+    if "log_return" in returns.columns:
+        returns = returns[["log_return"]].rename(columns={"log_return": "ewma"})
+
+    values = returns.to_numpy(dtype=np.float64)
+    seed = np.mean(values[:30] ** 2, axis=0)
+    sigma = np.sqrt(ewma_variance(values, lam, seed))
+
+    out = pd.DataFrame(sigma, index=returns.index, columns=returns.columns)
+    return out.shift(1).iloc[1:]
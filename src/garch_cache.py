@@ -0,0 +1,94 @@
+import hashlib
+
+import pandas as pd
+
+from src.cache import CACHE_ROOT, DiskCache
+from src.garch_models import MODEL_REGISTRY, GarchFit, GarchSpec, fit_spec, run_parallel
+
+GARCH_CACHE_ROOT = CACHE_ROOT / "garch"
+
+
+def returns_fingerprint(returns: pd.Series) -> str:
+    """
+    SHA-256 over per-row hashes of a return series' dates and values, so
+    any revised, appended or dropped observation changes the fingerprint.
+    """
+    rows = pd.util.hash_pandas_object(returns, index=True).to_numpy()
+    return hashlib.sha256(rows.tobytes()).hexdigest()
+
+
+class GarchFitCache:
+    """
+    Persistent cache of GarchFit results (parameters, covariance matrix,
+    conditional volatility and fit statistics).
+
+    Entries are keyed by (spec, engine, returns fingerprint): identical
+    inputs return the stored fit without optimising. Alongside each fit
+    the latest parameters per (spec, engine, label) are kept, so when the
+    data changes (e.g. one more day of prices) the refit warm-starts from
+    the previous optimum instead of arch's default grid.
+
+    Storage, TTL and size-bounded LRU eviction are those of DiskCache.
+    """
+
+    def __init__(self, cache: DiskCache = None):
+        self.cache = cache if cache is not None else DiskCache(GARCH_CACHE_ROOT, max_bytes=256 * 1024 ** 2)
+
+    # ---------------------------------------------------------------
+    # Keys
+    # ---------------------------------------------------------------
+    def _fit_key(self, fingerprint: str, spec: GarchSpec, engine: str) -> str:
+        return self.cache.make_key("garch_fit", spec, engine, fingerprint)
+
+    def _warm_key(self, label, spec: GarchSpec, engine: str) -> str:
+        return self.cache.make_key("garch_params", spec, engine, label)
+
+    # ---------------------------------------------------------------
+    # Fitting
+    # ---------------------------------------------------------------
+    def fit(
+        self,
+        returns: pd.Series,
+        spec: GarchSpec,
+        engine: str = "arch",
+        label=None
+    ) -> GarchFit:
+        """
+        Cached fit_spec. `label` identifies the series for warm starts
+        (default: returns.name).
+        """
+        return self.fit_all(returns, [spec], n_workers=1, engine=engine, label=label)[spec.name]
+
+    def fit_all(
+        self,
+        returns: pd.Series,
+        specs=None,
+        n_workers: int = None,
+        engine: str = "arch",
+        label=None
+    ) -> dict:
+        """
+        Cached fit_all: hits are served from disk, misses are fitted in a
+        process pool (warm-started where possible) and stored.
+
+        Returns
+        -------
+        dict name -> GarchFit, in spec order.
+        """
+        specs = list(MODEL_REGISTRY.values()) if specs is None else list(specs)
+        label = returns.name if label is None else label
+        fingerprint = returns_fingerprint(returns)
+
+        fits = {s.name: self.cache.get(self._fit_key(fingerprint, s, engine)) for s in specs}
+        missing = [s for s in specs if fits[s.name] is None]
+
+        jobs = [
+            (returns, s, engine, self.cache.get(self._warm_key(label, s, engine)))
+            for s in missing
+        ]
+        for fit in run_parallel(fit_spec, jobs, n_workers):
+            self.cache.set(self._fit_key(fingerprint, fit.spec, engine), fit)
+            self.cache.set(self._warm_key(label, fit.spec, engine), fit.params.to_numpy())
+            fits[fit.spec.name] = fit
+
+        return fits
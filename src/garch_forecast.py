@@ -0,0 +1,237 @@
+import numpy as np
+import pandas as pd
+
+from src.garch_models import GarchFit
+from src.garch_state import EGARCH_ABS_MEAN
+
+# -------------------------------------------------------------------
+# Multi-step GARCH forecasts for many tickers at once
+# -------------------------------------------------------------------
+# Inputs are GarchState objects (one per ticker): fixed parameters plus
+# the one-step-ahead variance after the last observed return. Outputs are
+# decimal daily variances for steps 1..horizon (tickers x steps); the
+# h-day variance of the cumulative return is their running sum.
+#
+# GARCH / GJR have closed-form expected variance paths. EGARCH does not
+# (E[h] involves the whole log-variance distribution), and return
+# quantiles under t or bootstrapped innovations need the full path
+# distribution, so those go through Monte Carlo: simulated paths are
+# generated in chunks of at most `chunk_size` (ticker, path) cells, so
+# memory stays bounded however many tickers and paths are requested.
+
+FORECAST_METHODS = ("auto", "analytic", "simulation")
+
+
+def _stack_states(states: dict) -> pd.DataFrame:
+    """
+    One row per ticker: vol type, parameters and next-step variance
+    (percent^2), missing parameters filled with their neutral values.
+    """
+    rows = {
+        ticker: {
+            "vol": s.vol,
+            "variance": s.variance,
+            "mu": s.params.get("mu", 0.0),
+            "omega": s.params["omega"],
+            "alpha": s.params["alpha[1]"],
+            "gamma": s.params.get("gamma[1]", 0.0),
+            "beta": s.params["beta[1]"],
+            "nu": s.params.get("nu", np.nan),
+        }
+        for ticker, s in states.items()
+    }
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def _steps(horizon: int) -> pd.Index:
+    return pd.RangeIndex(1, horizon + 1, name="step")
+
+
+def standardized_residuals(fit: GarchFit, returns: pd.Series) -> pd.Series:
+    """
+    z_t = (r_t - mu) / sigma_t of a fitted model, for bootstrap forecasts.
+    """
+    mu = fit.params.get("mu", 0.0) / 100
+    return ((returns - mu) / fit.conditional_vol).dropna().rename(fit.spec.name)
+
+
+# -------------------------------------------------------------------
+# Analytic (GARCH / GJR)
+# -------------------------------------------------------------------
+def analytic_variance(states: dict, horizon: int = 10) -> pd.DataFrame:
+    """
+    Expected daily variance paths for GARCH / GJR states.
+
+    E[h_{T+k}] = hbar + phi^(k-1) (h_{T+1} - hbar),
+    phi = alpha + gamma / 2 + beta, hbar = omega / (1 - phi)
+
+    (gamma / 2 = gamma P(z < 0) for any symmetric innovation law, so the
+    path is the same under normal and t innovations). Integrated models
+    (phi = 1) grow linearly by omega per step.
+    """
+    table = _stack_states(states)
+    if (table["vol"] != "Garch").any():
+        raise ValueError("analytic forecasts cover GARCH / GJR only; use simulation for EGARCH")
+
+    phi = (table["alpha"] + 0.5 * table["gamma"] + table["beta"]).to_numpy()[:, None]
+    omega = table["omega"].to_numpy()[:, None]
+    h1 = table["variance"].to_numpy()[:, None]
+    k = np.arange(horizon)[None, :]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hbar = omega / (1 - phi)
+        paths = np.where(
+            np.isclose(phi, 1.0),
+            h1 + omega * k,
+            hbar + phi ** k * (h1 - hbar)
+        )
+
+    return pd.DataFrame(paths / 1e4, index=table.index, columns=_steps(horizon))
+
+
+# -------------------------------------------------------------------
+# Simulation / bootstrap
+# -------------------------------------------------------------------
+def _draw_innovations(rng, nu, pools, lengths, size):
+    """
+    Standardized innovations (n_tickers, size): bootstrap from `pools`
+    if given, else standardized Student-t where nu is set, normal otherwise.
+    """
+    n = len(nu)
+    if pools is not None:
+        idx = (rng.random((n, size)) * lengths[:, None]).astype(np.int64)
+        return np.take_along_axis(pools.T, idx, axis=1)
+
+    z = np.empty((n, size))
+    is_t = ~np.isnan(nu)
+    z[~is_t] = rng.standard_normal((int((~is_t).sum()), size))
+    if is_t.any():
+        df = nu[is_t][:, None]
+        z[is_t] = rng.standard_t(df, (int(is_t.sum()), size)) * np.sqrt((df - 2) / df)
+    return z
+
+
+def simulate_forecast(
+    states: dict,
+    horizon: int = 10,
+    n_sims: int = 10_000,
+    residuals: dict = None,
+    quantiles=(0.01, 0.025, 0.05),
+    chunk_size: int = 1_000_000,
+    seed: int = None
+):
+    """
+    Monte Carlo (or filtered-bootstrap) variance and return forecasts.
+
+    Parameters
+    ----------
+    states : dict
+        ticker -> GarchState (GARCH, GJR or EGARCH).
+    residuals : dict, optional
+        ticker -> standardized residuals (see standardized_residuals);
+        when given, innovations are resampled from them (filtered
+        historical simulation) instead of drawn from normal / t.
+    quantiles : iterable of float
+        Quantiles of the cumulative `horizon`-day return to report.
+    chunk_size : int
+        Upper bound on simulated (ticker, path) cells held at once; only
+        the float32 cumulative returns (tickers x n_sims) are kept whole,
+        for the quantiles.
+
+    Returns
+    -------
+    variance : pd.DataFrame
+        Mean simulated daily variance (decimal), tickers x steps.
+    return_quantiles : pd.DataFrame
+        Quantiles of the cumulative horizon-day log return, tickers x q.
+    """
+    table = _stack_states(states)
+    rng = np.random.default_rng(seed)
+    n = len(table)
+
+    pools = lengths = None
+    if residuals is not None:
+        arrays = [np.asarray(residuals[t], dtype=np.float64) for t in table.index]
+        arrays = [a[~np.isnan(a)] for a in arrays]
+        lengths = np.array([len(a) for a in arrays])
+        pools = np.zeros((lengths.max(), n))
+        for j, a in enumerate(arrays):
+            pools[:len(a), j] = a
+
+    mu, omega, alpha, gamma, beta, h1, nu = (
+        table[c].to_numpy(dtype=np.float64)[:, None]
+        for c in ("mu", "omega", "alpha", "gamma", "beta", "variance", "nu")
+    )
+    egarch = (table["vol"] == "EGarch").to_numpy()[:, None]
+
+    variance_sum = np.zeros((n, horizon))
+    cumulative = np.empty((n, n_sims), dtype=np.float32)
+
+    paths_per_chunk = max(1, chunk_size // max(n, 1))
+    for lo in range(0, n_sims, paths_per_chunk):
+        m = min(paths_per_chunk, n_sims - lo)
+        h = np.repeat(h1, m, axis=1)
+        total = np.zeros((n, m))
+
+        for k in range(horizon):
+            variance_sum[:, k] += h.sum(axis=1)
+            z = _draw_innovations(rng, nu[:, 0], pools, lengths, m)
+            e = np.sqrt(h) * z
+            total += mu + e
+
+            garch_next = omega + (alpha + gamma * (e < 0)) * e * e + beta * h
+            log_next = omega + alpha * (np.abs(z) - EGARCH_ABS_MEAN) + gamma * z + beta * np.log(h)
+            h = np.where(egarch, np.exp(log_next), garch_next)
+
+        cumulative[:, lo:lo + m] = total / 100
+
+    variance = pd.DataFrame(variance_sum / n_sims / 1e4, index=table.index, columns=_steps(horizon))
+    q = np.asarray(quantiles, dtype=np.float64)
+    return_quantiles = pd.DataFrame(
+        np.quantile(cumulative, q, axis=1).T,
+        index=table.index,
+        columns=pd.Index(q, name="quantile")
+    )
+    return variance, return_quantiles
+
+
+# -------------------------------------------------------------------
+# Dispatch
+# -------------------------------------------------------------------
+def forecast_variance(
+    states: dict,
+    horizon: int = 10,
+    method: str = "auto",
+    **sim_kwargs
+) -> pd.DataFrame:
+    """
+    Daily variance paths (decimal, tickers x steps) for many tickers.
+
+    method='auto' uses the closed form for GARCH / GJR tickers and
+    simulation for EGARCH tickers; 'analytic' / 'simulation' force one
+    path for all. `sim_kwargs` go to simulate_forecast.
+    """
+    if method not in FORECAST_METHODS:
+        raise ValueError(f"method must be one of {FORECAST_METHODS}")
+
+    if method == "analytic":
+        return analytic_variance(states, horizon)
+    if method == "simulation":
+        return simulate_forecast(states, horizon, **sim_kwargs)[0]
+
+    garch = {t: s for t, s in states.items() if s.vol == "Garch"}
+    other = {t: s for t, s in states.items() if s.vol != "Garch"}
+    parts = []
+    if garch:
+        parts.append(analytic_variance(garch, horizon))
+    if other:
+        parts.append(simulate_forecast(other, horizon, **sim_kwargs)[0])
+    return pd.concat(parts).reindex(list(states))
+
+
+def horizon_volatility(variance: pd.DataFrame) -> pd.DataFrame:
+    """
+    Volatility of the cumulative k-day return for every k (sqrt of the
+    running sum of daily variances), e.g. column 10 for 10-day VaR.
+    """
+    return np.sqrt(variance.cumsum(axis=1))
@@ -1,67 +1,348 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
 from arch.univariate import arch_model
+import numpy as np
 import pandas as pd
 
+from src.garch_native import fit_garch_panel
 
-def garch_vol(returns):
-    model = arch_model(
+ENGINES = ("arch", "native")
+
+# -------------------------------------------------------------------
+# Model registry
+# -------------------------------------------------------------------
+@dataclass(frozen=True)
+class GarchSpec:
+    """
+    Declarative univariate volatility model (arch_model arguments).
+
+    Returns are fitted in percent (x100), as arch recommends, and
+    conditional volatility is reported back in decimal.
+    """
+    name: str
+    vol: str = "Garch"
+    p: int = 1
+    o: int = 0
+    q: int = 1
+    dist: str = "normal"
+
+
+MODEL_REGISTRY = {
+    "garch": GarchSpec("garch"),
+    "egarch": GarchSpec("egarch", vol="EGarch"),
+    "tgarch": GarchSpec("tgarch", o=1),
+    "garch_t": GarchSpec("garch_t", dist="t"),
+}
+
+
+@dataclass
+class GarchFit:
+    """
+    Result of fitting one GarchSpec.
+    """
+    spec: GarchSpec
+    conditional_vol: pd.Series
+    params: pd.Series
+    loglikelihood: float
+    aic: float
+    bic: float
+    fit_time: float
+    converged: bool
+    param_cov: pd.DataFrame = None
+
+
+# -------------------------------------------------------------------
+# Fitting
+# -------------------------------------------------------------------
+def build_model(returns: pd.Series, spec: GarchSpec):
+    return arch_model(
         returns * 100,
-        vol="Garch",
-        p=1,
-        q=1,
-        dist="normal"
+        vol=spec.vol,
+        p=spec.p,
+        o=spec.o,
+        q=spec.q,
+        dist=spec.dist
     )
-    res = model.fit(disp="off")
-    return pd.Series(
-        res.conditional_volatility / 100,
-        index=returns.index,
-        name="garch"
+
+
+def supports_native(spec: GarchSpec) -> bool:
+    """
+    Whether the native NumPy engine (src.garch_native) covers this spec:
+    GARCH(1,1) or GJR-GARCH(1,1,1) with normal or Student-t innovations.
+    """
+    return (
+        spec.vol == "Garch"
+        and spec.p == 1 and spec.q == 1 and spec.o in (0, 1)
+        and spec.dist in ("normal", "t")
     )
 
 
-def egarch_vol(returns):
-    model = arch_model(
-        returns * 100,
-        vol="EGarch",
-        p=1,
-        q=1,
-        dist="normal"
+def _fit_native(returns: pd.Series, spec: GarchSpec, starting_values=None) -> GarchFit:
+    t0 = time.perf_counter()
+    res = fit_garch_panel(
+        returns.rename(spec.name),
+        o=spec.o,
+        dist=spec.dist,
+        start_values=starting_values
     )
-    res = model.fit(disp="off")
-    return pd.Series(
-        res.conditional_volatility / 100,
-        index=returns.index,
-        name="egarch"
+    fit_time = time.perf_counter() - t0
+
+    loglikelihood = float(res.loglikelihood.iloc[0])
+    k = res.params.shape[1]
+    return GarchFit(
+        spec=spec,
+        conditional_vol=res.conditional_vol.iloc[:, 0],
+        params=res.params.iloc[0].rename("params"),
+        loglikelihood=loglikelihood,
+        aic=-2 * loglikelihood + 2 * k,
+        bic=-2 * loglikelihood + k * np.log(len(returns)),
+        fit_time=fit_time,
+        converged=bool(res.converged.iloc[0]),
+        param_cov=pd.DataFrame(res.param_cov[0], index=res.params.columns, columns=res.params.columns)
     )
 
 
-def tgarch_vol(returns):
-    model = arch_model(
-        returns * 100,
-        vol="Garch",
-        p=1,
-        o=1,
-        q=1,
-        dist="normal"
-    )
-    res = model.fit(disp="off")
-    return pd.Series(
-        res.conditional_volatility / 100,
-        index=returns.index,
-        name="tgarch"
+def fit_spec(
+    returns: pd.Series,
+    spec: GarchSpec,
+    engine: str = "arch",
+    starting_values=None
+) -> GarchFit:
+    """
+    Fit one spec on the full sample (in-sample conditional volatility).
+
+    engine='native' uses the vectorized NumPy estimator for the specs it
+    supports (see supports_native) and falls back to arch otherwise; both
+    engines maximise the same likelihood and agree to optimiser tolerance.
+    `starting_values` (e.g. the parameters of a previous fit of the same
+    spec) warm-start the optimiser.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}")
+    if engine == "native" and supports_native(spec):
+        return _fit_native(returns, spec, starting_values)
+
+    t0 = time.perf_counter()
+    model = build_model(returns, spec)
+    if starting_values is not None:
+        starting_values = _feasible_start(model, np.asarray(starting_values, dtype=np.float64))
+    res = model.fit(disp="off", starting_values=starting_values)
+    fit_time = time.perf_counter() - t0
+
+    return GarchFit(
+        spec=spec,
+        conditional_vol=pd.Series(
+            res.conditional_volatility / 100,
+            index=returns.index,
+            name=spec.name
+        ),
+        params=res.params,
+        loglikelihood=float(res.loglikelihood),
+        aic=float(res.aic),
+        bic=float(res.bic),
+        fit_time=fit_time,
+        converged=res.convergence_flag == 0,
+        param_cov=res.param_cov
     )
 
 
-def garch_t_vol(returns):
-    model = arch_model(
-        returns * 100,
-        vol="Garch",
-        p=1,
-        q=1,
-        dist="t"
+def _call(job):
+    fn, args = job
+    return fn(*args)
+
+
+def run_parallel(fn, arg_list: list, n_workers: int = None) -> list:
+    """
+    map(fn, arg_list) over a process pool, preserving order.
+
+    n_workers=1 (or a single job) runs in-process, which avoids pool
+    start-up cost and keeps tracebacks simple.
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers == 1 or len(arg_list) <= 1:
+        return [fn(*args) for args in arg_list]
+
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(arg_list))) as pool:
+        return list(pool.map(_call, [(fn, args) for args in arg_list]))
+
+
+def fit_all(
+    returns: pd.Series,
+    specs=None,
+    n_workers: int = None,
+    engine: str = "arch"
+) -> dict:
+    """
+    Fit several specs concurrently in a process pool.
+
+    Parameters
+    ----------
+    specs : iterable of GarchSpec, optional
+        Defaults to every spec in MODEL_REGISTRY.
+    n_workers : int, optional
+        Process count (default: os.cpu_count()).
+    engine : str
+        'arch' or 'native', see fit_spec.
+
+    Returns
+    -------
+    dict name -> GarchFit, in spec order.
+    """
+    specs = list(MODEL_REGISTRY.values()) if specs is None else list(specs)
+    fits = run_parallel(fit_spec, [(returns, s, engine) for s in specs], n_workers)
+    return {fit.spec.name: fit for fit in fits}
+
+
+def fit_summary(fits: dict) -> pd.DataFrame:
+    """
+    One row per fit: log-likelihood, AIC, BIC, fit time and convergence.
+    """
+    return pd.DataFrame({
+        name: {
+            "loglikelihood": f.loglikelihood,
+            "aic": f.aic,
+            "bic": f.bic,
+            "fit_time": f.fit_time,
+            "converged": f.converged,
+        }
+        for name, f in fits.items()
+    }).T
+
+
+# -------------------------------------------------------------------
+# Out-of-sample rolling re-estimation
+# -------------------------------------------------------------------
+def _feasible_start(model, params: np.ndarray) -> np.ndarray:
+    """
+    Nudge warm-start parameters back inside the volatility constraints.
+
+    A previous fit can sit exactly on a boundary (e.g. alpha + beta = 1),
+    which arch rejects as a starting value; shrinking the dynamics
+    parameters slightly (omega untouched) restores feasibility.
+    """
+    a, b = model.volatility.constraints()
+    k = model.num_params
+    vol = params[k:k + a.shape[1]].copy()
+    for _ in range(50):
+        if np.all(a @ vol - b >= 0):
+            break
+        vol[1:] *= 0.999
+    out = params.copy()
+    out[k:k + len(vol)] = vol
+    return out
+
+
+def _refit_block(returns, spec, refits, window, horizon_len):
+    """
+    Sequential warm-started refits for one block of refit points.
+
+    Each refit at position i fits on [i - window, i) (expanding if window
+    is None) and produces one-step-ahead variance forecasts for targets
+    i .. i + horizon_len - 1 by filtering forward with the fitted
+    parameters -- forecast origin t only ever sees returns up to t.
+
+    The block's first refit is a cold fit on its own window (arch's
+    default starting values); every later one warm-starts from its
+    predecessor.
+    """
+    model = build_model(returns, spec)
+    n = len(returns)
+    params = None
+    sigmas = []
+    param_rows = []
+
+    for i in refits:
+        first = 0 if window is None else i - window
+        res = model.fit(
+            first_obs=first,
+            last_obs=i,
+            starting_values=None if params is None else _feasible_start(model, params),
+            disp="off"
+        )
+        params = res.params.to_numpy()
+
+        stop = min(i + horizon_len, n)
+        fc = res.forecast(horizon=1, start=i - 1, reindex=False)
+        var = fc.variance.iloc[:stop - i, 0].to_numpy()
+
+        sigmas.append(np.sqrt(var) / 100)
+        param_rows.append(res.params)
+
+    return sigmas, param_rows
+
+
+def rolling_garch_forecast(
+    returns: pd.Series,
+    spec: GarchSpec,
+    window: int = 1000,
+    refit_every: int = 5,
+    block_size: int = 25,
+    n_workers: int = None
+):
+    """
+    Genuine one-step-ahead volatility forecasts by rolling re-estimation.
+
+    The model is refitted every `refit_every` days on the trailing
+    `window` returns (window=None: expanding), and between refits the
+    last parameters filter the new data forward, so the forecast for day
+    t uses returns up to t-1 only -- no look-ahead.
+
+    Refits are grouped into blocks of `block_size` consecutive refits;
+    blocks run in parallel on a process pool and, within a block, each
+    refit warm-starts from the previous window's parameters. Each block
+    seeds itself with a cold fit on its own first window, so those seed
+    fits run in parallel too and every block starts close to its own
+    optimum rather than to the first window's.
+
+    Returns
+    -------
+    sigma : pd.Series
+        One-step-ahead volatility (decimal) indexed by target date.
+    params : pd.DataFrame
+        Fitted parameters indexed by the first target date of each refit.
+    """
+    n = len(returns)
+    first_target = window if window is not None else 250
+    refits = list(range(first_target, n, refit_every))
+    if not refits:
+        raise ValueError("not enough observations for the first window")
+
+    blocks = [refits[k:k + block_size] for k in range(0, len(refits), block_size)]
+    results = run_parallel(
+        _refit_block,
+        [(returns, spec, b, window, refit_every) for b in blocks],
+        n_workers
+    )
+
+    sigma = np.concatenate([v for block_sigmas, _ in results for v in block_sigmas])
+    params = pd.DataFrame(
+        [p for _, block_params in results for p in block_params],
+        index=returns.index[refits]
     )
-    res = model.fit(disp="off")
-    return pd.Series(
-        res.conditional_volatility / 100,
-        index=returns.index,
-        name="garch_t"
+
+    return (
+        pd.Series(sigma, index=returns.index[first_target:], name=f"{spec.name}_oos"),
+        params
     )
+
+
+# -------------------------------------------------------------------
+# Single-model wrappers
+# -------------------------------------------------------------------
+def garch_vol(returns):
+    return fit_spec(returns, MODEL_REGISTRY["garch"]).conditional_vol
+
+
+def egarch_vol(returns):
+    return fit_spec(returns, MODEL_REGISTRY["egarch"]).conditional_vol
+
+
+def tgarch_vol(returns):
+    return fit_spec(returns, MODEL_REGISTRY["tgarch"]).conditional_vol
+
+
+def garch_t_vol(returns):
+    return fit_spec(returns, MODEL_REGISTRY["garch_t"]).conditional_vol
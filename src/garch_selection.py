@@ -0,0 +1,201 @@
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+from src.garch_models import GarchSpec, fit_spec, run_parallel
+
+# -------------------------------------------------------------------
+# Search space
+# -------------------------------------------------------------------
+GRID_VOLS = ("Garch", "EGarch")
+GRID_ORDERS = ((1, 0, 1), (1, 1, 1), (2, 0, 1), (1, 0, 2), (2, 0, 2), (2, 1, 1))
+GRID_DISTS = ("normal", "t", "skewt")
+BASE_ORDER = (1, 0, 1)
+
+CRITERIA = ("aic", "bic")
+
+
+def spec_name(vol: str, p: int, o: int, q: int, dist: str) -> str:
+    return f"{vol.lower()}({p},{o},{q})_{dist}"
+
+
+def make_grid(vols=GRID_VOLS, orders=GRID_ORDERS, dists=GRID_DISTS) -> list:
+    """
+    Every (vol, order, dist) combination as a GarchSpec.
+    """
+    return [
+        GarchSpec(spec_name(vol, p, o, q, dist), vol=vol, p=p, o=o, q=q, dist=dist)
+        for vol, (p, o, q), dist in product(vols, orders, dists)
+    ]
+
+
+# -------------------------------------------------------------------
+# Search
+# -------------------------------------------------------------------
+BOARD_COLUMNS = [
+    "ticker", "model", "vol", "p", "o", "q", "dist", "n_params",
+    "loglikelihood", "aic", "bic", "converged", "fit_time", "error",
+]
+
+
+def _grid_job(ticker, returns, spec, engine):
+    """
+    Fit one (ticker, spec) and return only its scores, so pool workers
+    ship back a small dict rather than the conditional-vol series.
+
+    A fit that raises still yields a row, with NaN scores and the
+    exception in `error`.
+    """
+    row = {
+        "ticker": ticker,
+        "model": spec.name,
+        "vol": spec.vol,
+        "p": spec.p,
+        "o": spec.o,
+        "q": spec.q,
+        "dist": spec.dist,
+    }
+    try:
+        fit = fit_spec(returns, spec, engine)
+    except (ValueError, RuntimeError, FloatingPointError, ArithmeticError) as exc:
+        row.update({
+            "n_params": np.nan,
+            "loglikelihood": np.nan,
+            "aic": np.nan,
+            "bic": np.nan,
+            "converged": False,
+            "fit_time": np.nan,
+            "error": f"{type(exc).__name__}: {exc}",
+        })
+        return row
+
+    row.update({
+        "n_params": len(fit.params),
+        "loglikelihood": fit.loglikelihood,
+        "aic": fit.aic,
+        "bic": fit.bic,
+        "converged": fit.converged,
+        "fit_time": fit.fit_time,
+        "error": None,
+    })
+    return row
+
+
+def _run(jobs, n_workers):
+    return run_parallel(_grid_job, jobs, n_workers)
+
+
+def grid_search(
+    returns,
+    vols=GRID_VOLS,
+    orders=GRID_ORDERS,
+    dists=GRID_DISTS,
+    criterion: str = "bic",
+    prune_margin: float = 10.0,
+    n_workers: int = None,
+    engine: str = "arch"
+) -> pd.DataFrame:
+    """
+    Information-criterion model selection per ticker over a spec grid.
+
+    Two stages, each one flat batch of (ticker, spec) jobs on a process
+    pool:
+
+    1. every vol x distribution at BASE_ORDER (1,0,1);
+    2. the remaining orders, but only for the (ticker, vol, dist)
+       combinations whose base fit is within `prune_margin` of that
+       ticker's best base fit. Innovation distributions are ranked very
+       stably across orders, so a distribution that loses by e.g. 10
+       BIC points at (1,0,1) is dominated and is not refitted at the
+       higher orders.
+
+    Parameters
+    ----------
+    returns : pd.DataFrame, pd.Series or dict
+        Decimal returns: dates x tickers (NaNs dropped per ticker), a
+        single series, or ticker -> series.
+    criterion : str
+        'aic' or 'bic', used for pruning and ranking.
+    prune_margin : float
+        Criterion distance from the best base fit beyond which a
+        (vol, dist) is pruned; None fits the full grid.
+
+    Returns
+    -------
+    pd.DataFrame leaderboard, one row per attempted (ticker, spec), sorted
+    by ticker then criterion, with `rank` (1 = best) and `delta`
+    (criterion minus the ticker's best). Fits that raised are kept with
+    NaN scores, no rank, and the exception in `error`.
+    """
+    if criterion not in CRITERIA:
+        raise ValueError(f"criterion must be one of {CRITERIA}")
+
+    if isinstance(returns, pd.Series):
+        series = {returns.name or "series": returns.dropna()}
+    elif isinstance(returns, pd.DataFrame):
+        series = {t: returns[t].dropna() for t in returns.columns}
+    else:
+        series = {t: r.dropna() for t, r in returns.items()}
+
+    base = make_grid(vols, [BASE_ORDER], dists)
+    rows = _run([(t, r, s, engine) for t, r in series.items() for s in base], n_workers)
+
+    extra_orders = [order for order in orders if tuple(order) != BASE_ORDER]
+    if extra_orders and rows:
+        board = pd.DataFrame(rows, columns=BOARD_COLUMNS)
+        board = board[board["error"].isna()]
+        # Prune against the best converged base fit where there is one
+        by_ticker = board.groupby("ticker")
+        best = (
+            board[criterion].where(board["converged"].astype(bool))
+            .groupby(board["ticker"]).transform("min")
+            .fillna(by_ticker[criterion].transform("min"))
+        )
+        keep = board if prune_margin is None else board[board[criterion] - best <= prune_margin]
+
+        jobs = [
+            (row.ticker, series[row.ticker], s, engine)
+            for row in keep.itertuples()
+            for s in make_grid([row.vol], extra_orders, [row.dist])
+        ]
+        rows += _run(jobs, n_workers)
+
+    return leaderboard(pd.DataFrame(rows, columns=BOARD_COLUMNS), criterion)
+
+
+def leaderboard(results: pd.DataFrame, criterion: str = "bic") -> pd.DataFrame:
+    """
+    Rank fitted specs within each ticker by `criterion`.
+
+    Converged fits rank ahead of fits whose optimizer did not converge,
+    so rank 1 only goes to a non-converged fit when a ticker has no
+    converged one. `delta` is measured from the rank-1 fit. Failed fits
+    (NaN criterion) sort last and get no rank or delta.
+    """
+    unconverged = ~results["converged"].astype(bool)
+    board = (
+        results.assign(_unconverged=unconverged)
+        .sort_values(["ticker", "_unconverged", criterion], na_position="last")
+        .drop(columns="_unconverged")
+        .reset_index(drop=True)
+    )
+    if board.empty:
+        return board.assign(rank=pd.Series(dtype="Int64"), delta=pd.Series(dtype="float64"))
+
+    scored = board[criterion].notna()
+    board["rank"] = scored.groupby(board["ticker"]).cumsum().where(scored).astype("Int64")
+    board["delta"] = board[criterion] - board.groupby("ticker")[criterion].transform("first")
+    return board
+
+
+def best_specs(board: pd.DataFrame) -> dict:
+    """
+    ticker -> winning GarchSpec from a leaderboard. Only converged fits
+    qualify: tickers with no converged fit are left out.
+    """
+    top = board[(board["rank"] == 1).fillna(False) & board["converged"].astype(bool)]
+    return {
+        row.ticker: GarchSpec(row.model, vol=row.vol, p=int(row.p), o=int(row.o), q=int(row.q), dist=row.dist)
+        for row in top.itertuples()
+    }
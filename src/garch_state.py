@@ -0,0 +1,106 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.garch_models import GarchFit
+
+# E|z| for a standard normal, arch's EGARCH centring constant
+EGARCH_ABS_MEAN = np.sqrt(2 / np.pi)
+
+STATE_VOLS = ("Garch", "EGarch")
+
+
+class GarchState:
+    """
+    Online conditional variance of a fitted GARCH / GJR / EGARCH(1,1).
+
+    GARCH / GJR : h' = omega + (alpha + gamma 1[e < 0]) e^2 + beta h
+    EGARCH      : ln h' = omega + alpha (|z| - sqrt(2/pi)) + gamma z + beta ln h
+
+    with e = 100 r - mu and z = e / sqrt(h), i.e. the same recursion (on
+    percent returns) arch used to fit the parameters. `update` is O(1);
+    `sigma` is the one-step-ahead daily volatility forecast (decimal)
+    given all returns seen so far. Parameters stay fixed -- refit (e.g.
+    via GarchFitCache) to re-estimate them. The state round-trips through
+    to_dict / save / load.
+    """
+
+    def __init__(self, vol: str, params: dict, variance: float, n_obs: int = 0):
+        if vol not in STATE_VOLS:
+            raise ValueError(f"vol must be one of {STATE_VOLS}")
+        self.vol = vol
+        self.params = {k: float(v) for k, v in params.items()}
+        self.variance = float(variance)
+        self.n_obs = n_obs
+
+    # ---------------------------------------------------------------
+    # Seeding
+    # ---------------------------------------------------------------
+    @classmethod
+    def from_fit(cls, fit: GarchFit, returns: pd.Series) -> "GarchState":
+        """
+        State after the last return of the fitted sample.
+
+        `returns` are the (decimal) returns the fit was estimated on; only
+        the last one is used, to step the final fitted variance forward.
+        """
+        spec = fit.spec
+        if spec.vol not in STATE_VOLS or spec.p != 1 or spec.q != 1 or spec.o > 1:
+            raise ValueError(f"GarchState supports (1,1) GARCH/GJR/EGARCH, not {spec}")
+
+        last = fit.conditional_vol.dropna()
+        state = cls(spec.vol, fit.params.to_dict(), (100 * last.iloc[-1]) ** 2, len(last) - 1)
+        state.update(returns.loc[last.index[-1]])
+        return state
+
+    # ---------------------------------------------------------------
+    # Online update
+    # ---------------------------------------------------------------
+    def update(self, r: float) -> float:
+        """
+        Absorb one (decimal) return; returns the new volatility forecast.
+        """
+        if np.isnan(r):
+            return self.sigma
+
+        p = self.params
+        e = 100.0 * r - p.get("mu", 0.0)
+        alpha, gamma, beta = p["alpha[1]"], p.get("gamma[1]", 0.0), p["beta[1]"]
+
+        if self.vol == "Garch":
+            self.variance = p["omega"] + (alpha + gamma * (e < 0)) * e * e + beta * self.variance
+        else:
+            z = e / np.sqrt(self.variance)
+            self.variance = float(np.exp(
+                p["omega"] + alpha * (abs(z) - EGARCH_ABS_MEAN) + gamma * z
+                + beta * np.log(self.variance)
+            ))
+
+        self.n_obs += 1
+        return self.sigma
+
+    @property
+    def sigma(self) -> float:
+        return float(np.sqrt(self.variance)) / 100
+
+    # ---------------------------------------------------------------
+    # Persistence
+    # ---------------------------------------------------------------
+    def to_dict(self) -> dict:
+        return {"vol": self.vol, "params": self.params, "variance": self.variance, "n_obs": self.n_obs}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "GarchState":
+        return cls(d["vol"], d["params"], d["variance"], d["n_obs"])
+
+    def save(self, path: Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict()))
+
+    @classmethod
+    def load(cls, path: Path) -> "GarchState":
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+    def __repr__(self) -> str:
+        return f"GarchState(vol={self.vol!r}, sigma={self.sigma:.6g}, n_obs={self.n_obs})"
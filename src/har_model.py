@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+
+HAR_HORIZONS = (1, 5, 22)     # daily / weekly / monthly components
+
+
+def create_har_features(
+    returns: pd.DataFrame,
+    realized_vol: pd.DataFrame,
+    horizons=HAR_HORIZONS,
+    daily_variance: pd.Series = None
+) -> pd.DataFrame:
+    """
+    HAR-RV regressors (Corsi 2009): volatility over the last 1, 5 and 22
+    days, each built from a daily variance proxy known at the close of
+    day t,
+
+        har_h = sqrt(mean(daily_variance_{t-h+1..t}))
+
+    daily_variance defaults to squared daily returns; pass a daily
+    realized variance instead (e.g. the 'rv' column of
+    daily_realized_measures) when intraday bars are available.
+
+    Target:
+        Next-day realized volatility (same as create_volatility_features,
+        so the walk-forward outputs line up with the ML models)
+    """
+    if daily_variance is None:
+        daily_variance = returns["log_return"] ** 2
+    daily_variance = daily_variance.reindex(returns.index)
+
+    df = pd.DataFrame(index=returns.index)
+
+    for h in horizons:
+        df[f"har_{h}"] = np.sqrt(daily_variance.rolling(h).mean())
+
+    df["target"] = realized_vol["realized_vol"].shift(-1)
+
+    df = df.dropna()
+    return df
+
+
+class SlidingLeastSquares:
+    """
+    Least squares over a sliding window of rows, updated in O(k^2) per row.
+
+    P = (X'X)^-1 and X'y are kept; adding or dropping a row x is a
+    Sherman-Morrison rank-one update of P:
+
+        add  : P <- P - P x x' P / (1 + x' P x)
+        drop : P <- P + P x x' P / (1 - x' P x)
+
+    so sliding the window never refits from scratch. Every `refresh`
+    updates P is recomputed from the accumulated X'X to stop rounding
+    drift.
+    """
+
+    def __init__(self, k: int, refresh: int = 1000):
+        self.xtx = np.zeros((k, k))
+        self.xty = np.zeros(k)
+        self.P = None
+        self.refresh = refresh
+        self._updates = 0
+
+    def fit(self, X: np.ndarray, y: np.ndarray) -> "SlidingLeastSquares":
+        self.xtx = X.T @ X
+        self.xty = X.T @ y
+        self.P = np.linalg.inv(self.xtx)
+        self._updates = 0
+        return self
+
+    def _rank_one(self, x, y, sign):
+        self.xtx += sign * np.outer(x, x)
+        self.xty += sign * y * x
+        Px = self.P @ x
+        self.P -= sign * np.outer(Px, Px) / (1.0 + sign * (x @ Px))
+
+        self._updates += 1
+        if self._updates >= self.refresh:
+            self.P = np.linalg.inv(self.xtx)
+            self._updates = 0
+
+    def add(self, X: np.ndarray, y: np.ndarray) -> None:
+        for xi, yi in zip(X, y):
+            self._rank_one(xi, yi, 1.0)
+
+    def drop(self, X: np.ndarray, y: np.ndarray) -> None:
+        for xi, yi in zip(X, y):
+            self._rank_one(xi, yi, -1.0)
+
+    @property
+    def coef(self) -> np.ndarray:
+        return self.P @ self.xty
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return X @ self.coef
+
+
+def walk_forward_har_forecast(
+    data,
+    window=750,          # ~3 years
+    step=5               # re-estimate weekly
+):
+    """
+    Walk-forward HAR-RV forecasting with the same windows and output
+    contract as walk_forward_ml_forecast: (predictions, actuals, rmse).
+
+    The OLS window slides by `step` rows per re-estimation through
+    rank-one updates (SlidingLeastSquares) instead of a refit.
+    """
+    X = data.drop(columns=["target"]).to_numpy(dtype=np.float64)
+    X = np.column_stack([np.ones(len(X)), X])
+    y = data["target"].to_numpy(dtype=np.float64)
+
+    predictions = []
+    actuals = []
+
+    ols = None
+    for i in range(window, len(X), step):
+        if ols is None:
+            ols = SlidingLeastSquares(X.shape[1]).fit(X[:window], y[:window])
+        else:
+            ols.add(X[i - step:i], y[i - step:i])
+            ols.drop(X[i - window - step:i - window], y[i - window - step:i - window])
+
+        predictions.extend(ols.predict(X[i:i + step]))
+        actuals.extend(y[i:i + step])
+
+    predictions = np.array(predictions)
+    actuals = np.array(actuals)
+    rmse = np.sqrt(np.mean((actuals - predictions) ** 2))
+    return predictions, actuals, rmse
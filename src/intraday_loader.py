@@ -0,0 +1,126 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# -------------------------------------------------------------------
+# Intraday bar files
+# -------------------------------------------------------------------
+# One file per ticker (per year, per month, ...), rows sorted by time:
+#
+#     timestamp,price
+#     2024-01-02 09:31:00,472.65
+#     ...
+#
+# CSV and Parquet are both read in fixed-size chunks, so memory is bounded
+# by the chunk size plus one trading day regardless of file size.
+TIME_COLUMN = "timestamp"
+PRICE_COLUMN = "price"
+
+STAT_COLUMNS = ["n_returns", "sum_sq", "sum_abs_prod", "open", "close"]
+
+
+def _iter_chunks(path: Path, chunksize: int, time_col: str, price_col: str):
+    path = Path(path)
+    if path.suffix == ".parquet":
+        import pyarrow.parquet as pq
+
+        pf = pq.ParquetFile(path)
+        for batch in pf.iter_batches(batch_size=chunksize, columns=[time_col, price_col]):
+            yield batch.to_pandas()
+    else:
+        reader = pd.read_csv(
+            path,
+            usecols=[time_col, price_col],
+            dtype={price_col: "float64"},
+            parse_dates=[time_col],
+            chunksize=chunksize
+        )
+        with reader:
+            yield from reader
+
+
+def iter_intraday_days(
+    path: Path,
+    chunksize: int = 1_000_000,
+    time_col: str = TIME_COLUMN,
+    price_col: str = PRICE_COLUMN
+):
+    """
+    Stream a bar file one trading day at a time.
+
+    A day that straddles a chunk boundary is carried into the next chunk,
+    so each day is yielded exactly once and complete.
+
+    Yields
+    ------
+    (day, times, prices) : (pd.Timestamp, datetime64 ndarray, float64 ndarray)
+    """
+    carry_t = np.empty(0, dtype="datetime64[ns]")
+    carry_p = np.empty(0, dtype=np.float64)
+
+    for chunk in _iter_chunks(path, chunksize, time_col, price_col):
+        times = np.concatenate([carry_t, chunk[time_col].to_numpy("datetime64[ns]")])
+        prices = np.concatenate([carry_p, chunk[price_col].to_numpy(np.float64)])
+        if len(times) == 0:
+            continue
+
+        days = times.astype("datetime64[D]")
+        bounds = np.flatnonzero(days[1:] != days[:-1]) + 1
+        starts = np.concatenate([[0], bounds])
+
+        # Everything up to the last day in the chunk is complete
+        for lo, hi in zip(starts[:-1], starts[1:]):
+            yield pd.Timestamp(days[lo]), times[lo:hi], prices[lo:hi]
+
+        carry_t = times[starts[-1]:].copy()
+        carry_p = prices[starts[-1]:].copy()
+
+    if len(carry_t):
+        yield pd.Timestamp(carry_t[0].astype("datetime64[D]")), carry_t, carry_p
+
+
+# -------------------------------------------------------------------
+# Daily sufficient statistics
+# -------------------------------------------------------------------
+def day_sufficient_stats(prices: np.ndarray) -> tuple:
+    """
+    Sufficient statistics of one day's intraday log returns.
+
+    n_returns    : number of intraday returns
+    sum_sq       : sum r_i^2             (realized variance)
+    sum_abs_prod : sum |r_i| |r_{i-1}|   (bipower variation, unscaled)
+    open, close  : first and last price
+    """
+    r = np.diff(np.log(prices))
+    abs_r = np.abs(r)
+    return (
+        len(r),
+        float(r @ r),
+        float(abs_r[1:] @ abs_r[:-1]),
+        float(prices[0]),
+        float(prices[-1]),
+    )
+
+
+def daily_sufficient_stats(
+    path: Path,
+    chunksize: int = 1_000_000,
+    time_col: str = TIME_COLUMN,
+    price_col: str = PRICE_COLUMN
+) -> pd.DataFrame:
+    """
+    Reduce a bar file to one row of sufficient statistics per day,
+    without ever materialising more than one chunk of bars.
+
+    Returns
+    -------
+    pd.DataFrame indexed by date with columns STAT_COLUMNS.
+    """
+    rows = {}
+    for day, _, prices in iter_intraday_days(path, chunksize, time_col, price_col):
+        rows[day] = day_sufficient_stats(prices)
+
+    stats = pd.DataFrame.from_dict(rows, orient="index", columns=STAT_COLUMNS)
+    stats.index.name = "Date"
+    return stats
@@ -5,15 +5,22 @@ from sklearn.ensemble import RandomForestRegressor
 from xgboost import XGBRegressor
 from sklearn.metrics import mean_squared_error
 
+from src.realized_vol import realized_volatility_multi
+
 
 def create_volatility_features(
     returns: pd.DataFrame,
     realized_vol: pd.DataFrame,
-    lags: int = 5
+    lags: int = 5,
+    rv_windows: list = None
 ) -> pd.DataFrame:
     """
     Create time-series safe ML features for volatility forecasting.
 
+    rv_windows optionally adds lagged multi-horizon realized vol
+    features (rv_{w}_lag_1), computed in one pass by
+    realized_volatility_multi.
+
     Target:
         Next-day realized volatility
     """
@@ -27,6 +34,12 @@ def create_volatility_features(
     for i in range(1, lags + 1):
         df[f"rv_lag_{i}"] = realized_vol["realized_vol"].shift(i)
 
+    # Multi-horizon realized volatility
+    if rv_windows:
+        rv_multi = realized_volatility_multi(returns, rv_windows)
+        for w in rv_windows:
+            df[f"rv_{w}_lag_1"] = rv_multi[(w, "realized_vol")].shift(1)
+
     # Rolling statistics
     df["ret_std_5"] = returns["log_return"].rolling(5).std()
     df["ret_std_21"] = returns["log_return"].rolling(21).std()
@@ -0,0 +1,118 @@
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+
+# -------------------------------------------------------------------
+# Schema
+# -------------------------------------------------------------------
+# Price CSVs are a leading ISO-8601 date column followed by numeric price
+# columns, e.g. data/raw/spy_prices.csv ("Date,price"). Declaring that up
+# front avoids pandas' per-column type inference and date guessing.
+DATE_FORMAT = "%Y-%m-%d"
+PRICE_DTYPES = ("float64", "float32")
+
+# pyarrow parses floats exactly; the C parser's default ("high") can be
+# one ulp off but reproduces the legacy read_csv path bit-for-bit.
+C_ENGINE_OPTIONS = {"date_format": DATE_FORMAT}
+
+
+def price_csv_schema(path: Path, dtype: str = "float64") -> tuple:
+    """
+    (date column, {column: dtype}) for a price CSV, read from its header.
+    """
+    if dtype not in PRICE_DTYPES:
+        raise ValueError(f"dtype must be one of {PRICE_DTYPES}")
+
+    header = pd.read_csv(path, nrows=0).columns
+    date_col, value_cols = header[0], header[1:]
+    return date_col, {c: dtype for c in value_cols}
+
+
+def read_price_csv(
+    path: Path,
+    dtype: str = "float64",
+    engine: str = "pyarrow",
+    chunksize: int = None,
+    columns: list = None
+) -> pd.DataFrame:
+    """
+    Read a price CSV with an explicit schema.
+
+    Parameters
+    ----------
+    dtype : str
+        'float64' (default) or 'float32' for the price columns.
+    engine : str
+        'pyarrow' (default): pyarrow.csv with typed columns, so dates are
+        parsed natively rather than as strings in pandas. 'c': the pandas
+        C parser.
+    chunksize : int, optional
+        Read in chunks of this many rows with the C engine and concatenate,
+        bounding parser memory on very large files.
+    columns : list, optional
+        Price columns to keep (default: all).
+
+    Returns
+    -------
+    pd.DataFrame indexed by date.
+    """
+    if chunksize is not None:
+        return pd.concat(
+            iter_price_csv(path, chunksize, dtype=dtype, columns=columns)
+        )
+
+    date_col, dtypes = price_csv_schema(path, dtype)
+    if columns is not None:
+        dtypes = {c: dtypes[c] for c in columns}
+
+    if engine == "pyarrow":
+        column_types = {date_col: pa.timestamp("ns")}
+        column_types.update({c: pa.from_numpy_dtype(t) for c, t in dtypes.items()})
+        table = pa_csv.read_csv(
+            path,
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                include_columns=[date_col, *dtypes]
+            )
+        )
+        return table.to_pandas().set_index(date_col)
+
+    if engine != "c":
+        raise ValueError("engine must be 'pyarrow' or 'c'")
+
+    df = pd.read_csv(
+        path,
+        usecols=[date_col, *dtypes],
+        dtype=dtypes,
+        parse_dates=[date_col],
+        **C_ENGINE_OPTIONS
+    )
+    return df.set_index(date_col)
+
+
+def iter_price_csv(
+    path: Path,
+    chunksize: int,
+    dtype: str = "float64",
+    columns: list = None
+):
+    """
+    Yield a price CSV as date-indexed frames of at most `chunksize` rows.
+    """
+    date_col, dtypes = price_csv_schema(path, dtype)
+    if columns is not None:
+        dtypes = {c: dtypes[c] for c in columns}
+
+    reader = pd.read_csv(
+        path,
+        usecols=[date_col, *dtypes],
+        dtype=dtypes,
+        parse_dates=[date_col],
+        index_col=date_col,
+        chunksize=chunksize,
+        **C_ENGINE_OPTIONS
+    )
+    with reader:
+        yield from reader
@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+
+from src.price_store import STORE_ROOT, read_prices
+
+
+class PricePanel:
+    """
+    Aligned multi-asset price panel.
+
+    One shared, sorted trading-date index and one (n_dates, n_tickers)
+    float matrix stored column-major (Fortran order), so every ticker's
+    history is a contiguous block and `column()` returns a view without
+    copying. Date slicing is a row slice of the same buffer, so it is a
+    view as well. Missing observations are NaN.
+
+    Parameters
+    ----------
+    values : array-like, shape (n_dates, n_tickers)
+    dates : array-like of dates (must be unique)
+    tickers : sequence of str (must be unique)
+    """
+
+    def __init__(self, values, dates, tickers):
+        values = np.asarray(values)
+        if values.dtype not in (np.float32, np.float64):
+            values = values.astype(np.float64)
+        values = np.asfortranarray(values)
+
+        dates = pd.DatetimeIndex(dates, name="Date")
+        tickers = tuple(tickers)
+
+        if values.ndim != 2 or values.shape != (len(dates), len(tickers)):
+            raise ValueError(
+                f"values shape {values.shape} does not match "
+                f"({len(dates)} dates, {len(tickers)} tickers)"
+            )
+        if not dates.is_unique:
+            raise ValueError("dates must be unique")
+        if len(set(tickers)) != len(tickers):
+            raise ValueError("tickers must be unique")
+
+        if not dates.is_monotonic_increasing:
+            order = np.argsort(dates.values, kind="stable")
+            dates = dates[order]
+            values = np.asfortranarray(values[order])
+
+        self.values = values
+        self.dates = dates
+        self.tickers = tickers
+        self._loc = {t: i for i, t in enumerate(tickers)}
+
+    # ---------------------------------------------------------------
+    # Constructors
+    # ---------------------------------------------------------------
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "PricePanel":
+        """
+        Build from a wide DataFrame (dates x tickers), e.g. a batch download.
+        """
+        return cls(df.to_numpy(dtype=np.float64), df.index, df.columns)
+
+    @classmethod
+    def from_frames(cls, frames: dict, column: str = "price") -> "PricePanel":
+        """
+        Outer-align per-ticker frames (or Series) on the union of their dates.
+        """
+        series = {
+            t: (f[column] if isinstance(f, pd.DataFrame) else f)
+            for t, f in frames.items()
+        }
+        dates = pd.DatetimeIndex(sorted(set().union(*(s.index for s in series.values()))))
+
+        values = np.full((len(dates), len(series)), np.nan, order="F")
+        for j, s in enumerate(series.values()):
+            values[dates.get_indexer(s.index), j] = s.to_numpy(dtype=np.float64)
+
+        return cls(values, dates, series.keys())
+
+    @classmethod
+    def from_store(
+        cls,
+        tickers: list,
+        column: str = "price",
+        start: str = None,
+        end: str = None,
+        root=STORE_ROOT
+    ) -> "PricePanel":
+        """
+        Load one column for many tickers from the columnar store.
+        """
+        frames = {
+            t: read_prices(t, columns=[column], start=start, end=end, root=root)
+            for t in tickers
+        }
+        return cls.from_frames(frames, column)
+
+    # ---------------------------------------------------------------
+    # Access
+    # ---------------------------------------------------------------
+    @property
+    def shape(self) -> tuple:
+        return self.values.shape
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __contains__(self, ticker) -> bool:
+        return ticker in self._loc
+
+    def __repr__(self) -> str:
+        span = f"{self.dates[0].date()}..{self.dates[-1].date()}" if len(self) else "empty"
+        return f"PricePanel({len(self.dates)} dates x {len(self.tickers)} tickers, {span})"
+
+    def ticker_index(self, ticker: str) -> int:
+        try:
+            return self._loc[ticker]
+        except KeyError:
+            raise KeyError(f"{ticker} not in panel") from None
+
+    def column(self, ticker: str) -> np.ndarray:
+        """
+        Contiguous, zero-copy view of one ticker's prices.
+        """
+        return self.values[:, self.ticker_index(ticker)]
+
+    __getitem__ = column
+
+    def series(self, ticker: str) -> pd.Series:
+        """
+        One ticker as a Series backed by the panel buffer.
+        """
+        return pd.Series(self.column(ticker), index=self.dates, name=ticker, copy=False)
+
+    def slice_dates(self, start=None, end=None) -> "PricePanel":
+        """
+        Inclusive date range [start, end] as a view of the same buffer.
+        """
+        lo = 0 if start is None else self.dates.searchsorted(pd.Timestamp(start), "left")
+        hi = len(self.dates) if end is None else self.dates.searchsorted(pd.Timestamp(end), "right")
+        return self._view(slice(lo, max(lo, hi)))
+
+    def select(self, tickers: list) -> "PricePanel":
+        """
+        Sub-panel with the given tickers (copies the selected columns).
+        """
+        idx = [self.ticker_index(t) for t in tickers]
+        return PricePanel(self.values[:, idx], self.dates, tickers)
+
+    def _view(self, rows: slice) -> "PricePanel":
+        panel = object.__new__(PricePanel)
+        panel.values = self.values[rows]
+        panel.dates = self.dates[rows]
+        panel.tickers = self.tickers
+        panel._loc = self._loc
+        return panel
+
+    # ---------------------------------------------------------------
+    # Conversion
+    # ---------------------------------------------------------------
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Wide DataFrame (dates x tickers).
+        """
+        return pd.DataFrame(self.values, index=self.dates, columns=list(self.tickers))
+
+    def log_returns(self) -> "PricePanel":
+        """
+        Panel of daily log returns r_t = log(P_t / P_{t-1}) (first date dropped).
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            logp = np.log(self.values)
+        return PricePanel(np.diff(logp, axis=0), self.dates[1:], self.tickers)
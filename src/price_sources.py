@@ -0,0 +1,414 @@
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.cache import DiskCache
+from src.price_csv import read_price_csv
+from src.price_store import STORE_SUFFIX, read_prices
+
+
+# -------------------------------------------------------------------
+# Interface
+# -------------------------------------------------------------------
+class PriceSource(ABC):
+    """
+    Provider of daily price history for a single ticker.
+
+    Implementations return a date-indexed DataFrame covering [start, end)
+    (end exclusive, as in yfinance), or an empty frame when the source has
+    no data for the request. Columns depend on `fields`:
+
+    - 'price' : ['price'] (adjusted close)
+    - 'ohlcv' : ['price', 'open', 'high', 'low', 'volume'], with open/high/
+                low scaled by the same adjustment factor as the close
+
+    `rate_limit` is the maximum number of fetches per second the source
+    tolerates (None = unlimited); batch downloads share one limiter per
+    source across all workers.
+
+    Failures that may succeed on a later attempt (rate limits, network
+    errors) are raised as TransientFetchError, which batch downloads
+    retry; an empty frame or ValueError means the source confirmed there
+    is no data.
+    """
+
+    name = "base"
+    rate_limit = None
+
+    @abstractmethod
+    def fetch(
+        self,
+        ticker: str,
+        start: str = "2005-01-01",
+        end: str = None,
+        fields: str = "price"
+    ) -> pd.DataFrame:
+        ...
+
+
+class TransientFetchError(RuntimeError):
+    """
+    The source could not deliver data this time; safe to retry.
+    """
+
+
+FIELDS = {
+    "price": ["price"],
+    "ohlcv": ["price", "open", "high", "low", "volume"],
+}
+
+
+def field_columns(fields: str) -> list:
+    if fields not in FIELDS:
+        raise ValueError(f"fields must be one of {sorted(FIELDS)}")
+    return FIELDS[fields]
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: at most `rate` acquisitions per second,
+    with bursts of up to `burst`.
+    """
+
+    def __init__(self, rate: float = None, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if not self.rate:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _clip_dates(df: pd.DataFrame, start=None, end=None) -> pd.DataFrame:
+    """
+    Restrict a date-indexed frame to [start, end).
+    """
+    mask = np.ones(len(df), dtype=bool)
+    if start is not None:
+        mask &= df.index >= pd.Timestamp(start)
+    if end is not None:
+        mask &= df.index < pd.Timestamp(end)
+    return df.loc[mask]
+
+
+# -------------------------------------------------------------------
+# yfinance (network)
+# -------------------------------------------------------------------
+_yf_lock = threading.Lock()
+_yf_raising = 0              # fetches currently inside _yfinance_raises
+_yf_saved = None             # caller's hide_exceptions, restored on exit
+
+
+@contextmanager
+def _yfinance_raises():
+    """
+    Make yfinance raise its errors instead of logging them, for the
+    duration of the block.
+
+    yf.config.debug.hide_exceptions is process-global, so concurrent
+    fetches share one switch: the first to enter turns it off and the
+    last to leave restores the caller's setting.
+    """
+    import yfinance as yf
+
+    global _yf_raising, _yf_saved
+    with _yf_lock:
+        if _yf_raising == 0:
+            _yf_saved = yf.config.debug.hide_exceptions
+            yf.config.debug.hide_exceptions = False
+        _yf_raising += 1
+    try:
+        yield
+    finally:
+        with _yf_lock:
+            _yf_raising -= 1
+            if _yf_raising == 0:
+                yf.config.debug.hide_exceptions = _yf_saved
+
+
+class YFinanceSource(PriceSource):
+    """
+    Yahoo Finance via yfinance.
+
+    Robust to:
+    - MultiIndex columns (new yfinance behavior)
+    - Missing 'Adj Close' (falls back to 'Close')
+    """
+
+    name = "yfinance"
+    rate_limit = 2.0
+
+    def fetch(self, ticker, start="2005-01-01", end=None, fields="price"):
+        import yfinance as yf
+        from yfinance.exceptions import YFTickerMissingError
+
+        columns = field_columns(fields)
+
+        # By default yfinance logs every per-ticker error (rate limits and
+        # network failures included) and returns an empty frame, so a
+        # transient failure would look like "no data". With
+        # hide_exceptions off, Ticker.history raises them instead.
+        try:
+            with _yfinance_raises():
+                df = yf.Ticker(ticker).history(
+                    start=start,
+                    end=end,
+                    auto_adjust=False,
+                    actions=False
+                )
+        except YFTickerMissingError:
+            # Delisted / unknown ticker or no prices in the range
+            return pd.DataFrame(columns=columns, dtype="float64")
+        except ValueError:
+            raise
+        except Exception as exc:
+            raise TransientFetchError(f"yfinance fetch failed for {ticker}: {exc}") from exc
+
+        if df.empty:
+            raise TransientFetchError(f"yfinance returned an empty response for {ticker}")
+
+        # Handle MultiIndex columns (yfinance >= 0.2.x)
+        if isinstance(df.columns, pd.MultiIndex):
+            df.columns = df.columns.get_level_values(0)
+
+        # Exchange-local timestamps -> naive dates, as yf.download returns
+        if df.index.tz is not None:
+            df.index = df.index.tz_localize(None)
+        df.index.name = "Date"
+
+        # Prefer Adjusted Close, fallback to Close
+        if "Adj Close" in df.columns:
+            price = df["Adj Close"]
+        elif "Close" in df.columns:
+            price = df["Close"]
+        else:
+            raise ValueError("Neither 'Adj Close' nor 'Close' found in data")
+
+        out = price.to_frame(name="price")
+
+        if fields == "ohlcv":
+            # Same response, no extra round-trip: scale the raw bars onto
+            # the adjusted-close basis (dividends and splits).
+            factor = price / df["Close"] if "Close" in df.columns else 1.0
+            for col in ("Open", "High", "Low"):
+                out[col.lower()] = df[col] * factor
+            out["volume"] = df["Volume"].astype("float64")
+
+        return out
+
+
+# -------------------------------------------------------------------
+# Local files (offline)
+# -------------------------------------------------------------------
+class FileSource(PriceSource):
+    """
+    Prices read from a local directory.
+
+    For ticker 'SPY' the first existing file among
+    ``SPY.arrow``, ``SPY.csv``, ``spy.csv`` and ``spy_prices.csv`` is used,
+    so both the columnar store (data/store) and the raw CSV drop
+    (data/raw) can serve as roots.
+    """
+
+    name = "file"
+
+    def __init__(self, root: Path = Path("data/raw")):
+        self.root = Path(root)
+
+    def _candidates(self, ticker):
+        for stem in (ticker, ticker.lower(), f"{ticker.lower()}_prices"):
+            for suffix in (STORE_SUFFIX, ".csv"):
+                yield self.root / f"{stem}{suffix}"
+
+    def fetch(self, ticker, start="2005-01-01", end=None, fields="price"):
+        columns = field_columns(fields)
+        for path in self._candidates(ticker):
+            if not path.exists():
+                continue
+            if path.suffix == STORE_SUFFIX:
+                df = read_prices(path.stem, root=self.root)
+            else:
+                df = read_price_csv(path)
+            missing = [c for c in columns if c not in df.columns]
+            if missing:
+                raise ValueError(f"{path.name} has no {missing} columns")
+            return _clip_dates(df[columns], start, end)
+
+        raise FileNotFoundError(f"No price file for {ticker} in {self.root}/")
+
+
+# -------------------------------------------------------------------
+# Synthetic (in-memory)
+# -------------------------------------------------------------------
+SYNTHETIC_EPOCH = pd.Timestamp("1990-01-01")
+
+
+class SyntheticSource(PriceSource):
+    """
+    Deterministic GARCH(1,1) price paths generated in memory.
+
+    Each ticker gets its own reproducible path (seeded from the ticker
+    name), so pipelines and benchmarks can run without any data on disk.
+    The path always starts at `start_price` on SYNTHETIC_EPOCH and a
+    request is a slice of it, so a given ticker and date have the same
+    price whatever range is asked for. Daily parameters default to
+    SPY-like values. For 'ohlcv', a fifth of each day's variance is
+    assigned to the overnight gap and the intraday path is simulated on
+    `intraday_steps` sub-steps to give high/low; that noise comes from a
+    separate per-ticker stream, drawn one row per date, so past bars do
+    not change as `end` moves.
+    """
+
+    name = "synthetic"
+
+    def __init__(
+        self,
+        seed: int = 0,
+        mu: float = 0.0003,
+        omega: float = 2e-6,
+        alpha: float = 0.10,
+        beta: float = 0.88,
+        start_price: float = 100.0,
+        intraday_steps: int = 26
+    ):
+        self.seed = seed
+        self.mu = mu
+        self.omega = omega
+        self.alpha = alpha
+        self.beta = beta
+        self.start_price = start_price
+        self.intraday_steps = intraday_steps
+
+    def _rng(self, ticker, stream):
+        return np.random.default_rng([self.seed, zlib.crc32(ticker.encode()), stream])
+
+    def fetch(self, ticker, start="2005-01-01", end=None, fields="price"):
+        columns = field_columns(fields)
+        end = pd.Timestamp.today().normalize() if end is None else pd.Timestamp(end)
+        dates = pd.bdate_range(SYNTHETIC_EPOCH, end - pd.Timedelta(days=1), name="Date")
+        keep = dates >= pd.Timestamp(start)
+        if not keep.any():
+            return pd.DataFrame(columns=columns, dtype="float64")
+
+        z = self._rng(ticker, 0).standard_normal(len(dates))
+
+        var = np.empty(len(dates))
+        var[0] = self.omega / (1 - self.alpha - self.beta)
+        log_ret = np.empty(len(dates))
+        log_ret[0] = 0.0
+        for t in range(1, len(dates)):
+            var[t] = self.omega + self.alpha * log_ret[t - 1] ** 2 + self.beta * var[t - 1]
+            log_ret[t] = np.sqrt(var[t]) * z[t]
+
+        log_close = np.log(self.start_price) + np.cumsum(log_ret + self.mu)
+        out = pd.DataFrame({"price": np.exp(log_close)}, index=dates)
+
+        if fields == "ohlcv":
+            # One row of noise per date: overnight gap, volume, then the
+            # intraday steps.
+            n = self.intraday_steps
+            noise = self._rng(ticker, 1).standard_normal((len(dates), n + 2))
+
+            # Overnight gap from the previous close, then an intraday
+            # Brownian bridge from the open to the (unchanged) close.
+            prev_close = np.concatenate([[np.log(self.start_price)], log_close[:-1]])
+            log_open = prev_close + np.sqrt(0.2 * var) * noise[:, 0]
+
+            walk = np.cumsum(noise[:, 2:], axis=1)
+            frac = np.arange(1, n + 1) / n
+            bridge = (walk - frac * walk[:, -1:]) * np.sqrt(0.8 * var / n)[:, None]
+            path = log_open[:, None] + frac * (log_close - log_open)[:, None] + bridge
+
+            out["open"] = np.exp(log_open)
+            out["high"] = np.exp(np.maximum(path.max(axis=1), log_open))
+            out["low"] = np.exp(np.minimum(path.min(axis=1), log_open))
+            out["volume"] = np.round(np.exp(16.0 + 0.3 * noise[:, 1]))
+
+        return out.loc[keep]
+
+
+# -------------------------------------------------------------------
+# Caching wrapper
+# -------------------------------------------------------------------
+class CachedSource(PriceSource):
+    """
+    Any PriceSource behind a DiskCache, keyed by (source config, ticker,
+    start, end).
+
+    An open-ended request (end=None) is keyed on today's date instead, so
+    "up to now" is re-fetched once a day rather than served from the
+    first response forever, even by a cache without a TTL.
+
+    The wrapped source's rate limit is enforced here on cache misses only,
+    so cache hits are never throttled by batch downloads.
+    """
+
+    rate_limit = None
+
+    def __init__(self, source: PriceSource, cache: DiskCache = None):
+        self.source = source
+        self.cache = cache if cache is not None else DiskCache()
+        self.name = f"cached:{source.name}"
+        self._limiter = RateLimiter(source.rate_limit)
+
+    def fetch(self, ticker, start="2005-01-01", end=None, fields="price"):
+        key_end = pd.Timestamp.today().normalize() if end is None else end
+        key = self.cache.make_key(
+            self.source.name,
+            sorted(vars(self.source).items()),
+            ticker,
+            str(start),
+            str(key_end),
+            fields
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        self._limiter.acquire()
+        df = self.source.fetch(ticker, start=start, end=end, fields=fields)
+        if not df.empty:
+            self.cache.set(key, df)
+        return df
+
+
+# -------------------------------------------------------------------
+# Registry
+# -------------------------------------------------------------------
+PRICE_SOURCES = {
+    "yfinance": YFinanceSource,
+    "file": FileSource,
+    "synthetic": SyntheticSource,
+}
+
+
+def get_price_source(name: str, **kwargs) -> PriceSource:
+    """
+    Instantiate a registered price source by name.
+    """
+    if name not in PRICE_SOURCES:
+        raise ValueError(
+            f"Unknown price source '{name}' (expected one of {sorted(PRICE_SOURCES)})"
+        )
+    return PRICE_SOURCES[name](**kwargs)
@@ -0,0 +1,144 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# -------------------------------------------------------------------
+# Layout
+# -------------------------------------------------------------------
+# One uncompressed Arrow IPC (Feather v2) file per ticker. Uncompressed
+# files can be memory-mapped, so column / date-range projection only
+# touches the pages that are actually read.
+STORE_ROOT = Path("data/store")
+STORE_SUFFIX = ".arrow"
+INDEX_COLUMN = "Date"
+
+
+def partition_path(ticker: str, root: Path = STORE_ROOT) -> Path:
+    """
+    Path of the store partition for a ticker.
+    """
+    return Path(root) / f"{ticker}{STORE_SUFFIX}"
+
+
+def list_tickers(root: Path = STORE_ROOT) -> list:
+    """
+    Tickers with a partition in the store, sorted.
+    """
+    root = Path(root)
+    if not root.exists():
+        return []
+    return sorted(p.stem for p in root.glob(f"*{STORE_SUFFIX}"))
+
+
+# -------------------------------------------------------------------
+# Write
+# -------------------------------------------------------------------
+def write_prices(
+    df: pd.DataFrame,
+    ticker: str,
+    root: Path = STORE_ROOT
+) -> Path:
+    """
+    Write a date-indexed frame to the ticker's partition.
+
+    The write goes to a temporary file that is then renamed over the
+    partition, so readers never see a half-written file.
+    """
+    path = partition_path(ticker, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    frame = df.sort_index()
+    frame.index = pd.DatetimeIndex(frame.index).astype("datetime64[ns]")
+    frame.index.name = INDEX_COLUMN
+
+    table = pa.Table.from_pandas(frame.reset_index(), preserve_index=False)
+
+    tmp = path.with_name(path.name + ".tmp")
+    with pa.OSFile(str(tmp), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp, path)
+
+    return path
+
+
+# -------------------------------------------------------------------
+# Read
+# -------------------------------------------------------------------
+def _open_table(path: Path, memory_map: bool = True) -> pa.Table:
+    source = pa.memory_map(str(path), "r") if memory_map else pa.OSFile(str(path), "rb")
+    return pa.ipc.open_file(source).read_all()
+
+
+def _date_bounds(table: pa.Table, start=None, end=None):
+    """
+    Row bounds [lo, hi) of the inclusive date range [start, end].
+    """
+    dates = table.column(INDEX_COLUMN).to_numpy()
+    lo = 0
+    hi = len(dates)
+    if start is not None:
+        lo = np.searchsorted(dates, np.datetime64(pd.Timestamp(start), "ns"), "left")
+    if end is not None:
+        hi = np.searchsorted(dates, np.datetime64(pd.Timestamp(end), "ns"), "right")
+    return int(lo), int(max(hi, lo))
+
+
+def last_stored_date(ticker: str, root: Path = STORE_ROOT):
+    """
+    Last date in a ticker's partition, or None if it has no partition.
+
+    Only the date column is touched, so this is cheap on large partitions.
+    """
+    path = partition_path(ticker, root)
+    if not path.exists():
+        return None
+    dates = _open_table(path).column(INDEX_COLUMN)
+    if len(dates) == 0:
+        return None
+    return pd.Timestamp(dates[-1].as_py())
+
+
+def read_prices(
+    ticker: str,
+    columns: list = None,
+    start: str = None,
+    end: str = None,
+    root: Path = STORE_ROOT,
+    memory_map: bool = True
+) -> pd.DataFrame:
+    """
+    Read a ticker's partition with optional column and date projection.
+
+    Parameters
+    ----------
+    ticker : str
+        Partition name.
+    columns : list, optional
+        Columns to materialise (default: all).
+    start, end : str, optional
+        Inclusive date bounds, same semantics as ``df.loc[start:end]``.
+    memory_map : bool
+        Map the file instead of reading it into memory.
+
+    Returns
+    -------
+    pd.DataFrame indexed by date.
+    """
+    path = partition_path(ticker, root)
+    if not path.exists():
+        raise FileNotFoundError(f"{ticker} not found in {root}/")
+
+    table = _open_table(path, memory_map)
+
+    if start is not None or end is not None:
+        lo, hi = _date_bounds(table, start, end)
+        table = table.slice(lo, hi - lo)
+
+    if columns is not None:
+        table = table.select([INDEX_COLUMN, *columns])
+
+    return table.to_pandas().set_index(INDEX_COLUMN)